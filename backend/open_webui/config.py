@@ -96,25 +96,32 @@ STATIC_DIR = Path(os.getenv('STATIC_DIR', OPEN_WEBUI_DIR / 'static')).resolve()
 
 try:
     if STATIC_DIR.exists():
-        for item in STATIC_DIR.iterdir():
-            if item.is_file() or item.is_symlink():
-                try:
-                    item.unlink()
-                except Exception as e:
-                    pass
+        # scandir reuses the entry type from the directory listing instead of a stat per item
+        with os.scandir(STATIC_DIR) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    try:
+                        os.unlink(entry.path)
+                    except Exception as e:
+                        pass
 except Exception as e:
     pass
 
-for file_path in (FRONTEND_BUILD_DIR / 'static').glob('**/*'):
-    if file_path.is_file():
-        target_path = STATIC_DIR / file_path.relative_to((FRONTEND_BUILD_DIR / 'static'))
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+FRONTEND_STATIC_DIR = FRONTEND_BUILD_DIR / 'static'
+
+for root, _, filenames in os.walk(FRONTEND_STATIC_DIR):
+    if not filenames:
+        continue
+    # Resolve and create each target directory once per directory rather than once per file
+    target_dir = os.path.join(STATIC_DIR, os.path.relpath(root, FRONTEND_STATIC_DIR))
+    os.makedirs(target_dir, exist_ok=True)
+    for filename in filenames:
         try:
-            shutil.copyfile(file_path, target_path)
+            shutil.copyfile(os.path.join(root, filename), os.path.join(target_dir, filename))
         except Exception as e:
             logging.error(f'An error occurred: {e}')
 
-frontend_favicon = FRONTEND_BUILD_DIR / 'static' / 'favicon.png'
+frontend_favicon = FRONTEND_STATIC_DIR / 'favicon.png'
 
 if frontend_favicon.exists():
     try:
@@ -122,7 +129,7 @@ if frontend_favicon.exists():
     except Exception as e:
         logging.error(f'An error occurred: {e}')
 
-frontend_splash = FRONTEND_BUILD_DIR / 'static' / 'splash.png'
+frontend_splash = FRONTEND_STATIC_DIR / 'splash.png'
 
 if frontend_splash.exists():
     try:
@@ -130,7 +137,7 @@ if frontend_splash.exists():
     except Exception as e:
         logging.error(f'An error occurred: {e}')
 
-frontend_loader = FRONTEND_BUILD_DIR / 'static' / 'loader.js'
+frontend_loader = FRONTEND_STATIC_DIR / 'loader.js'
 
 if frontend_loader.exists():
     try:
@@ -1256,6 +1263,9 @@ EXTERNAL_WEB_LOADER_URL = os.getenv('EXTERNAL_WEB_LOADER_URL', '')
 
 EXTERNAL_WEB_LOADER_API_KEY = os.getenv('EXTERNAL_WEB_LOADER_API_KEY', '')
 
+# URLs sent to the external loader per request; raise if the service accepts larger batches.
+EXTERNAL_WEB_LOADER_BATCH_SIZE = int(os.getenv('EXTERNAL_WEB_LOADER_BATCH_SIZE', '20'))
+
 YANDEX_WEB_SEARCH_URL = os.getenv('YANDEX_WEB_SEARCH_URL', '')
 
 YANDEX_WEB_SEARCH_API_KEY = os.getenv('YANDEX_WEB_SEARCH_API_KEY', '')
@@ -222,12 +222,14 @@ if FROM_INIT_PY:
     # Check if the data directory exists in the package directory
     if DATA_DIR.exists() and DATA_DIR != NEW_DATA_DIR:
         log.info(f'Moving {DATA_DIR} to {NEW_DATA_DIR}')
-        for item in DATA_DIR.iterdir():
-            dest = NEW_DATA_DIR / item.name
-            if item.is_dir():
-                shutil.copytree(item, dest, dirs_exist_ok=True)
-            else:
-                shutil.copy2(item, dest)
+        # scandir entries carry the file type from the directory listing, avoiding a stat per item
+        with os.scandir(DATA_DIR) as entries:
+            for entry in entries:
+                dest = NEW_DATA_DIR / entry.name
+                if entry.is_dir():
+                    shutil.copytree(entry.path, dest, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(entry.path, dest)
 
         # Zip the data directory
         shutil.make_archive(DATA_DIR.parent / 'open_webui_data', 'zip', DATA_DIR)
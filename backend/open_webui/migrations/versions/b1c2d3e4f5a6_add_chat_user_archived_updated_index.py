@@ -0,0 +1,28 @@
+"""Add chat user_id, archived, updated_at index
+
+Revision ID: b1c2d3e4f5a6
+Revises: 42e2978c7933
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'b1c2d3e4f5a6'
+down_revision = '42e2978c7933'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes('chat')}
+
+    if 'user_id_archived_updated_at_idx' not in existing_indexes:
+        op.create_index('user_id_archived_updated_at_idx', 'chat', ['user_id', 'archived', 'updated_at'])
+
+
+def downgrade():
+    op.drop_index('user_id_archived_updated_at_idx', table_name='chat')
@@ -0,0 +1,31 @@
+"""Add feedback user_id and type indexes
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-15 00:10:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = 'c2d3e4f5a6b7'
+down_revision = 'b1c2d3e4f5a6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing_indexes = {idx['name'] for idx in inspector.get_indexes('feedback')}
+
+    if 'ix_feedback_user_id_updated_at' not in existing_indexes:
+        op.create_index('ix_feedback_user_id_updated_at', 'feedback', ['user_id', 'updated_at'])
+    if 'ix_feedback_type' not in existing_indexes:
+        op.create_index('ix_feedback_type', 'feedback', ['type'])
+
+
+def downgrade():
+    op.drop_index('ix_feedback_type', table_name='feedback')
+    op.drop_index('ix_feedback_user_id_updated_at', table_name='feedback')
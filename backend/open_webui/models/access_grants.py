@@ -359,6 +359,36 @@ class AccessGrantsTable:
             await db.commit()
             return result.rowcount
 
+    async def revoke_all_access_by_resources(
+        self,
+        resource_type: str,
+        resource_ids: list[str],
+        db: Optional[AsyncSession] = None,
+    ) -> int:
+        """Remove all access grants for multiple resources in a single DELETE."""
+        if not resource_ids:
+            return 0
+        async with get_async_db_context(db) as db:
+            result = await db.execute(
+                delete(AccessGrant).filter(
+                    AccessGrant.resource_type == resource_type,
+                    AccessGrant.resource_id.in_(resource_ids),
+                )
+            )
+            await db.commit()
+            return result.rowcount
+
+    async def revoke_all_access_by_resource_type(
+        self,
+        resource_type: str,
+        db: Optional[AsyncSession] = None,
+    ) -> int:
+        """Remove every access grant of a resource type, e.g. when the whole table is wiped."""
+        async with get_async_db_context(db) as db:
+            result = await db.execute(delete(AccessGrant).filter_by(resource_type=resource_type))
+            await db.commit()
+            return result.rowcount
+
     async def set_access_control(
         self,
         resource_type: str,
@@ -530,8 +560,7 @@ class AccessGrantsTable:
             if user_group_ids is None:
                 from open_webui.models.groups import Groups
 
-                user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-                user_group_ids = {group.id for group in user_groups}
+                user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
 
             if user_group_ids:
                 conditions.append(
@@ -586,8 +615,7 @@ class AccessGrantsTable:
             if user_group_ids is None:
                 from open_webui.models.groups import Groups
 
-                user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-                user_group_ids = {group.id for group in user_groups}
+                user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
 
             if user_group_ids:
                 conditions.append(
@@ -275,8 +275,7 @@ class CalendarTable:
     async def get_calendars_by_user(self, user_id: str, db: Optional[AsyncSession] = None) -> list[CalendarModel]:
         """Owned + shared calendars."""
         async with get_async_db_context(db) as db:
-            user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-            user_group_ids = [g.id for g in user_groups]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             stmt = select(Calendar)
             stmt = AccessGrants.has_permission_filter(
@@ -480,8 +479,7 @@ class CalendarEventTable:
         Recurring events are fetched if they have any rrule (expansion in Python).
         """
         async with get_async_db_context(db) as db:
-            user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-            user_group_ids = [g.id for g in user_groups]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             # Get calendar IDs accessible to user
             cal_stmt = select(Calendar.id)
@@ -578,8 +576,7 @@ class CalendarEventTable:
         db: Optional[AsyncSession] = None,
     ) -> CalendarEventListResponse:
         async with get_async_db_context(db) as db:
-            user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-            user_group_ids = [g.id for g in user_groups]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             # Get accessible calendar IDs
             cal_stmt = select(Calendar.id)
@@ -393,7 +393,7 @@ class ChannelTable:
 
     async def get_channels_by_user_id(self, user_id: str, db: Optional[AsyncSession] = None) -> list[ChannelModel]:
         async with get_async_db_context(db) as db:
-            user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id, db=db)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             result = await db.execute(
                 select(Channel)
@@ -477,7 +477,12 @@ class ChannelTable:
             # 1. Collect all user_ids including groups + inviter
             requested_users = await self._collect_unique_user_ids(invited_by, user_ids, group_ids)
 
-            result = await db.execute(select(ChannelMember.user_id).filter(ChannelMember.channel_id == channel_id))
+            result = await db.execute(
+                select(ChannelMember.user_id).filter(
+                    ChannelMember.channel_id == channel_id,
+                    ChannelMember.user_id.in_(requested_users),
+                )
+            )
             existing_users = {row[0] for row in result.all()}
 
             new_user_ids = requested_users - existing_users
@@ -737,7 +742,7 @@ class ChannelTable:
                 return []
 
             # Preload user's group membership
-            user_group_ids = [g.id for g in await Groups.get_groups_by_member_id(user_id, db=db)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             allowed_channels = []
 
@@ -813,7 +818,7 @@ class ChannelTable:
             stmt = select(Channel).filter(Channel.id == id)
 
             # Determine user groups
-            user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id, db=db)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             # Apply ACL rules
             stmt = self._has_permission(
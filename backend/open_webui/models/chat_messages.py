@@ -1,6 +1,7 @@
 import json
 import time
 import uuid
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
 from sqlalchemy import select, delete, func, cast, Integer, distinct
@@ -645,8 +646,6 @@ class ChatMessageTable:
     ) -> dict[str, dict[str, int]]:
         """Get message counts grouped by day and model."""
         async with get_async_db_context(db) as db:
-            from datetime import datetime, timedelta
-
             from open_webui.models.groups import GroupMember
 
             stmt = select(ChatMessage.created_at, ChatMessage.model_id).filter(
@@ -693,8 +692,6 @@ class ChatMessageTable:
     ) -> dict[str, dict[str, int]]:
         """Get message counts grouped by hour and model."""
         async with get_async_db_context(db) as db:
-            from datetime import datetime, timedelta
-
             stmt = select(ChatMessage.created_at, ChatMessage.model_id).filter(
                 ChatMessage.role == 'assistant',
                 ChatMessage.model_id.isnot(None),
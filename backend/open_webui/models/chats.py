@@ -71,6 +71,7 @@ class Chat(Base):  # database table mapping for chat entity
         Index('user_id_archived_idx', 'user_id', 'archived'),
         Index('updated_at_user_id_idx', 'updated_at', 'user_id'),
         Index('folder_id_user_id_idx', 'folder_id', 'user_id'),
+        Index('user_id_archived_updated_at_idx', 'user_id', 'archived', 'updated_at'),
     )
 
 
@@ -1305,6 +1306,22 @@ class ChatTable:
             all_chats = result.scalars().all()
             return [ChatModel.model_validate(chat) for chat in all_chats]
 
+    async def get_chats_after(
+        self, last_id: str | None = None, limit: int = 50, db: AsyncSession | None = None
+    ) -> list[ChatModel]:
+        """
+        Keyset page of chats ordered by id, starting after last_id.
+
+        Ids never change, so chats updated while a caller walks the table
+        are neither skipped nor returned twice.
+        """
+        async with get_async_db_context(db) as session:
+            stmt = select(Chat).order_by(Chat.id).limit(limit)
+            if last_id is not None:
+                stmt = stmt.filter(Chat.id > last_id)
+            result = await session.execute(stmt)
+            return [ChatModel.model_validate(chat) for chat in result.scalars().all()]
+
     # list user conversations
     async def get_chats_by_user_id(
         self,
@@ -1787,6 +1804,33 @@ class ChatTable:
             result = await session.execute(stmt)
             return result.scalar()
 
+    async def count_chats_by_tag_ids_and_user_id(
+        self, tag_ids: list[str], user_id: str, db: AsyncSession | None = None
+    ) -> dict[str, int]:
+        """Count non-archived chats per tag for *user_id* in a single grouped query."""
+        if not tag_ids:
+            return {}
+        async with get_async_db_context(db) as session:
+            bind = await session.connection()
+            dialect_name = bind.dialect.name
+            if dialect_name == 'sqlite':
+                tags_source = "json_each(chat.meta, '$.tags') AS tag"
+            elif dialect_name == 'postgresql':
+                tags_source = "json_array_elements_text(chat.meta->'tags') AS tag(value)"
+            else:
+                raise NotImplementedError(f'Unsupported dialect: {dialect_name}')
+
+            stmt = text(
+                f'SELECT tag.value, COUNT(DISTINCT chat.id) FROM chat, {tags_source} '
+                'WHERE chat.user_id = :user_id AND chat.archived = :archived AND tag.value IN :tag_ids '
+                'GROUP BY tag.value'
+            ).bindparams(bindparam('tag_ids', expanding=True))
+            result = await session.execute(
+                stmt,
+                {'user_id': user_id, 'archived': False, 'tag_ids': list(tag_ids)},
+            )
+            return {row[0]: row[1] for row in result.all()}
+
     async def delete_orphan_tags_for_user(
         self,
         tag_ids: list[str],
@@ -1805,11 +1849,9 @@ class ChatTable:
         if not tag_ids:
             return
         async with get_async_db_context(db) as session:
-            orphans = []
-            for tag_id in tag_ids:
-                count = await self.count_chats_by_tag_name_and_user_id(tag_id, user_id, db=session)
-                if count <= threshold:
-                    orphans.append(tag_id)
+            normalized = {tag_id: tag_id.replace(' ', '_').lower() for tag_id in tag_ids}
+            counts = await self.count_chats_by_tag_ids_and_user_id(list(set(normalized.values())), user_id, db=session)
+            orphans = [tag_id for tag_id, normalized_id in normalized.items() if counts.get(normalized_id, 0) <= threshold]
             await Tags.delete_tags_by_ids_and_user_id(orphans, user_id, db=session)
 
     async def count_chats_by_folder_id_and_user_id(
@@ -1901,34 +1943,42 @@ class ChatTable:
         except Exception:
             return False
 
-    async def delete_chats_by_user_id_and_folder_id(
-        self, user_id: str, folder_id: str, db: AsyncSession | None = None
+    async def delete_chats_by_user_id_and_folder_ids(
+        self, user_id: str, folder_ids: list[str], db: AsyncSession | None = None
     ) -> bool:
+        if not folder_ids:
+            return True
+
         try:
             async with get_async_db_context(db) as session:
-                chat_ids_stmt = select(Chat.id).filter_by(user_id=user_id, folder_id=folder_id)
+                chat_ids_stmt = select(Chat.id).filter(Chat.user_id == user_id, Chat.folder_id.in_(folder_ids))
                 await session.execute(
                     update(AutomationRun).filter(AutomationRun.chat_id.in_(chat_ids_stmt)).values(chat_id=None)
                 )
                 await session.execute(delete(ChatMessage).filter(ChatMessage.chat_id.in_(chat_ids_stmt)))
-                await session.execute(delete(Chat).filter_by(user_id=user_id, folder_id=folder_id))
+                await session.execute(delete(Chat).filter(Chat.user_id == user_id, Chat.folder_id.in_(folder_ids)))
                 await session.commit()
 
                 return True
         except Exception:
             return False
 
-    async def move_chats_by_user_id_and_folder_id(
+    async def move_chats_by_user_id_and_folder_ids(
         self,
         user_id: str,
-        folder_id: str,
+        folder_ids: list[str],
         new_folder_id: str | None,
         db: AsyncSession | None = None,
     ) -> bool:
+        if not folder_ids:
+            return True
+
         try:
             async with get_async_db_context(db) as session:
                 await session.execute(
-                    update(Chat).filter_by(user_id=user_id, folder_id=folder_id).values(folder_id=new_folder_id)
+                    update(Chat)
+                    .filter(Chat.user_id == user_id, Chat.folder_id.in_(folder_ids))
+                    .values(folder_id=new_folder_id)
                 )
                 await session.commit()
 
@@ -1966,7 +2016,7 @@ class ChatTable:
             return None
 
         chat_message_file_ids = {
-            item.id for item in await self.get_chat_files_by_chat_id_and_message_id(chat_id, message_id, db=db)
+            item.file_id for item in await self.get_chat_files_by_chat_id_and_message_id(chat_id, message_id, db=db)
         }
         # Remove duplicates and existing file_ids
         file_ids = list({file_id for file_id in file_ids if file_id and file_id not in chat_message_file_ids})
@@ -1979,13 +2029,11 @@ class ChatTable:
         from open_webui.utils.access_control.files import has_access_to_file
 
         user = await Users.get_user_by_id(user_id, db=db)
+        file_owner_ids = await Files.get_file_user_ids_by_ids(file_ids, db=db)
         accessible_file_ids = []
-        for file_id in file_ids:
-            file = await Files.get_file_by_id(file_id, db=db)
-            if not file:
-                continue
+        for file_id, owner_id in file_owner_ids.items():
             if (
-                file.user_id == user_id
+                owner_id == user_id
                 or (user and user.role == 'admin')
                 or (user and await has_access_to_file(file_id, 'read', user, db=db))
             ):
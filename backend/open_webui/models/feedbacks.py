@@ -1,12 +1,14 @@
 import logging
 import time
 import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import Optional
 
 from open_webui.internal.db import Base, JSONField, get_async_db_context
 from open_webui.models.users import User, UserModel
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import JSON, BigInteger, Boolean, Column, Text, delete, func, select
+from sqlalchemy import JSON, BigInteger, Boolean, Column, Index, Text, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 log = logging.getLogger(__name__)
@@ -29,6 +31,11 @@ class Feedback(Base):
     created_at = Column(BigInteger)
     updated_at = Column(BigInteger)
 
+    __table_args__ = (
+        Index('ix_feedback_user_id_updated_at', 'user_id', 'updated_at'),
+        Index('ix_feedback_type', 'type'),
+    )
+
 
 class FeedbackModel(BaseModel):
     id: str
@@ -279,9 +286,14 @@ class FeedbackTable:
 
             return FeedbackListResponse(items=feedbacks, total=total)
 
-    async def get_all_feedbacks(self, db: Optional[AsyncSession] = None) -> list[FeedbackModel]:
+    async def get_all_feedbacks(
+        self, model_id: Optional[str] = None, db: Optional[AsyncSession] = None
+    ) -> list[FeedbackModel]:
         async with get_async_db_context(db) as db:
-            result = await db.execute(select(Feedback).order_by(Feedback.updated_at.desc()))
+            stmt = select(Feedback).order_by(Feedback.updated_at.desc())
+            if model_id:
+                stmt = stmt.filter(Feedback.data['model_id'].as_string() == model_id)
+            result = await db.execute(stmt)
             return [FeedbackModel.model_validate(feedback) for feedback in result.scalars().all()]
 
     async def get_all_feedback_ids(self, db: Optional[AsyncSession] = None) -> list[FeedbackIdResponse]:
@@ -326,18 +338,14 @@ class FeedbackTable:
         If days=0, returns all time data starting from first feedback.
         Returns: [{"date": "2026-01-08", "won": 5, "lost": 2}, ...]
         """
-        from collections import defaultdict
-        from datetime import datetime, timedelta
 
         async with get_async_db_context(db) as db:
-            if days == 0:
-                # All time - no cutoff
-                result = await db.execute(select(Feedback.created_at, Feedback.data))
-            else:
+            # Filter on the model in SQL rather than loading every feedback row
+            stmt = select(Feedback.created_at, Feedback.data).filter(Feedback.data['model_id'].as_string() == model_id)
+            if days != 0:
                 cutoff = int(time.time()) - (days * 86400)
-                result = await db.execute(
-                    select(Feedback.created_at, Feedback.data).filter(Feedback.created_at >= cutoff)
-                )
+                stmt = stmt.filter(Feedback.created_at >= cutoff)
+            result = await db.execute(stmt)
             rows = result.all()
 
         daily_counts = defaultdict(lambda: {'won': 0, 'lost': 0})
@@ -346,8 +354,6 @@ class FeedbackTable:
         for created_at, data in rows:
             if not data:
                 continue
-            if data.get('model_id') != model_id:
-                continue
 
             rating_str = str(data.get('rating', ''))
             if rating_str not in ('1', '-1'):
@@ -391,8 +397,6 @@ class FeedbackTable:
         db: Optional[AsyncSession] = None,
     ) -> list[ModelHistoryCounts]:
         """Get aggregated feedback counts per day for a model, preserving all matching days."""
-        from collections import defaultdict
-        from datetime import datetime
 
         async with get_async_db_context(db) as db:
             stmt = select(Feedback.created_at, Feedback.data).filter(Feedback.data['model_id'].as_string() == model_id)
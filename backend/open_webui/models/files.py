@@ -14,6 +14,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 log = logging.getLogger(__name__)
 
+# Upper bound on ids per IN (...) clause for bulk deletes
+DELETE_BATCH_SIZE = 1000
+
 
 class File(Base):  # uploaded file record
     __tablename__ = 'file'
@@ -227,6 +230,14 @@ class FilesTable:
             result = await db.execute(select(File).filter(File.id.in_(ids)).order_by(File.updated_at.desc()))
             return [FileModel.model_validate(file) for file in result.scalars().all()]
 
+    async def get_file_user_ids_by_ids(self, ids: list[str], db: AsyncSession | None = None) -> dict[str, str]:
+        """Return {file_id: user_id} for the given ids without loading file content."""
+        if not ids:
+            return {}
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(File.id, File.user_id).filter(File.id.in_(ids)))
+            return {row.id: row.user_id for row in result.all()}
+
     async def get_file_metadatas_by_ids(
         self, ids: list[str], db: AsyncSession | None = None
     ) -> list[FileMetadataResponse]:
@@ -453,6 +464,22 @@ class FilesTable:
             except Exception:
                 return False
 
+    async def delete_files_by_ids(self, ids: list[str], db: AsyncSession | None = None) -> bool:
+        if not ids:
+            return True
+
+        async with get_async_db_context(db) as db:
+            try:
+                # Chunk the IN list so very large deletes stay within the driver's bound-parameter
+                # limit, while still committing the whole delete as one transaction
+                for i in range(0, len(ids), DELETE_BATCH_SIZE):
+                    await db.execute(delete(File).filter(File.id.in_(ids[i : i + DELETE_BATCH_SIZE])))
+                await db.commit()
+
+                return True
+            except Exception:
+                return False
+
     async def delete_all_files(self, db: AsyncSession | None = None) -> bool:
         async with get_async_db_context(db) as db:
             try:
@@ -7,7 +7,7 @@ import time
 
 # local imports
 from open_webui.internal.db import Base, JSONField, get_async_db_context
-from open_webui.models.users import UserResponse, Users
+from open_webui.models.users import User, UserResponse, Users
 from open_webui.utils.valves import decrypt_valves, encrypt_valves
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import BigInteger, Boolean, Column, Index, String, Text, delete, select, update
@@ -234,12 +234,12 @@ class FunctionsTable:
 
     async def get_function_list(self, db: AsyncSession | None = None) -> list[FunctionUserResponse]:
         async with get_async_db_context(db) as db:
-            result = await db.execute(select(Function).order_by(Function.updated_at.desc()))
-            functions = result.scalars().all()
-            user_ids = list(set(func.user_id for func in functions))
-
-            users = await Users.get_users_by_user_ids(user_ids, db=db) if user_ids else []
-            users_dict = {user.id: user for user in users}
+            # Join the owner in the same query instead of a second users lookup merged in Python
+            result = await db.execute(
+                select(Function, User.id, User.name, User.role, User.email)
+                .outerjoin(User, User.id == Function.user_id)
+                .order_by(Function.updated_at.desc())
+            )
 
             return [
                 FunctionUserResponse.model_validate(
@@ -247,17 +247,17 @@ class FunctionsTable:
                         **FunctionResponse.model_validate(func).model_dump(),
                         'user': (
                             UserResponse(
-                                id=users_dict[func.user_id].id,
-                                name=users_dict[func.user_id].name,
-                                role=users_dict[func.user_id].role,
-                                email=users_dict[func.user_id].email,
+                                id=user_id,
+                                name=user_name,
+                                role=user_role,
+                                email=user_email,
                             ).model_dump()
-                            if func.user_id in users_dict
+                            if user_id is not None
                             else None
                         ),
                     }
                 )
-                for func in functions
+                for func, user_id, user_name, user_role, user_email in result.all()
             ]
 
     async def get_functions_by_type(
@@ -310,6 +310,12 @@ class GroupTable:
             )
             return [GroupModel.model_validate(group) for group in result.scalars().all()]
 
+    async def get_group_ids_by_member_id(self, user_id: str, db: Optional[AsyncSession] = None) -> list[str]:
+        """Return only the ids of the groups a user belongs to, without loading group rows."""
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(GroupMember.group_id).filter(GroupMember.user_id == user_id))
+            return [row[0] for row in result.all()]
+
     async def get_groups_by_member_ids(
         self, user_ids: list[str], db: Optional[AsyncSession] = None
     ) -> dict[str, list[GroupModel]]:
@@ -453,20 +459,13 @@ class GroupTable:
         async with get_async_db_context(db) as db:
             try:
                 # Find all groups the user belongs to
-                result = await db.execute(
-                    select(Group)
-                    .join(GroupMember, GroupMember.group_id == Group.id)
-                    .filter(GroupMember.user_id == user_id)
-                )
-                groups = result.scalars().all()
-
-                # Remove the user from each group
-                for group in groups:
-                    await db.execute(
-                        delete(GroupMember).filter(GroupMember.group_id == group.id, GroupMember.user_id == user_id)
-                    )
+                result = await db.execute(select(GroupMember.group_id).filter(GroupMember.user_id == user_id))
+                group_ids = [row[0] for row in result.all()]
 
-                    await db.execute(update(Group).filter_by(id=group.id).values(updated_at=int(time.time())))
+                # Remove the user from all of them at once
+                if group_ids:
+                    await db.execute(delete(GroupMember).filter(GroupMember.user_id == user_id))
+                    await db.execute(update(Group).filter(Group.id.in_(group_ids)).values(updated_at=int(time.time())))
 
                 await db.commit()
                 return True
@@ -478,13 +477,13 @@ class GroupTable:
     async def create_groups_by_group_names(
         self, user_id: str, group_names: list[str], db: Optional[AsyncSession] = None
     ) -> list[GroupModel]:
-        # check for existing groups
-        existing_groups = await self.get_all_groups(db=db)
-        existing_group_names = {group.name for group in existing_groups}
-
         new_groups = []
 
         async with get_async_db_context(db) as db:
+            # check for existing groups, letting the DB return only the requested names that already exist
+            result = await db.execute(select(Group.name).filter(Group.name.in_(group_names)))
+            existing_group_names = set(result.scalars().all())
+
             for group_name in group_names:
                 if group_name not in existing_group_names:
                     new_group = GroupModel(
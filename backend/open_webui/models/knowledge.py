@@ -230,32 +230,57 @@ class KnowledgeTable:
     ) -> list[KnowledgeUserModel]:
         async with get_async_db_context(db) as db:
             result = await db.execute(select(Knowledge).order_by(Knowledge.updated_at.desc()))
-            all_knowledge = result.scalars().all()
-            user_ids = list(set(knowledge.user_id for knowledge in all_knowledge))
-            knowledge_ids = [knowledge.id for knowledge in all_knowledge]
-
-            users = await Users.get_users_by_user_ids(user_ids, db=db) if user_ids else []
-            users_dict = {user.id: user for user in users}
-            grants_map = await AccessGrants.get_grants_by_resources('knowledge', knowledge_ids, db=db)
-
-            knowledge_bases = []
-            for knowledge in all_knowledge:
-                user = users_dict.get(knowledge.user_id)
-                knowledge_bases.append(
-                    KnowledgeUserModel.model_validate(
-                        {
-                            **(
-                                await self._to_knowledge_model(
-                                    knowledge,
-                                    access_grants=grants_map.get(knowledge.id, []),
-                                    db=db,
-                                )
-                            ).model_dump(),
-                            'user': user.model_dump() if user else None,
-                        }
-                    )
+            return await self._to_knowledge_user_models(result.scalars().all(), db=db)
+
+    async def _to_knowledge_user_models(self, all_knowledge, db: AsyncSession) -> list[KnowledgeUserModel]:
+        user_ids = list(set(knowledge.user_id for knowledge in all_knowledge))
+        knowledge_ids = [knowledge.id for knowledge in all_knowledge]
+
+        users = await Users.get_users_by_user_ids(user_ids, db=db) if user_ids else []
+        users_dict = {user.id: user for user in users}
+        grants_map = await AccessGrants.get_grants_by_resources('knowledge', knowledge_ids, db=db)
+
+        knowledge_bases = []
+        for knowledge in all_knowledge:
+            user = users_dict.get(knowledge.user_id)
+            knowledge_bases.append(
+                KnowledgeUserModel.model_validate(
+                    {
+                        **(
+                            await self._to_knowledge_model(
+                                knowledge,
+                                access_grants=grants_map.get(knowledge.id, []),
+                                db=db,
+                            )
+                        ).model_dump(),
+                        'user': user.model_dump() if user else None,
+                    }
                 )
-            return knowledge_bases
+            )
+        return knowledge_bases
+
+    async def get_knowledge_names(self, db: Optional[AsyncSession] = None) -> list:
+        """Return (id, name) rows for all knowledge bases, skipping owner and access grant resolution."""
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(Knowledge.id, Knowledge.name))
+            return result.all()
+
+    async def get_knowledge_summaries(self, db: Optional[AsyncSession] = None) -> list:
+        """Return (id, name, description) rows for all knowledge bases without hydrating full models."""
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(Knowledge.id, Knowledge.name, Knowledge.description))
+            return result.all()
+
+    async def count_knowledge_by_external_connection_id(
+        self, connection_id: str, db: Optional[AsyncSession] = None
+    ) -> int:
+        async with get_async_db_context(db) as db:
+            result = await db.execute(
+                select(func.count(Knowledge.id)).filter(
+                    Knowledge.meta[('external', 'connection_id')].as_string() == connection_id
+                )
+            )
+            return result.scalar() or 0
 
     async def search_knowledge_bases(
         self,
@@ -451,8 +476,7 @@ class KnowledgeTable:
             return False
         if knowledge.user_id == user_id:
             return True
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
         return await AccessGrants.has_access(
             user_id=user_id,
             resource_type='knowledge',
@@ -465,24 +489,20 @@ class KnowledgeTable:
     async def get_knowledge_bases_by_user_id(
         self, user_id: str, permission: str = 'write', db: Optional[AsyncSession] = None
     ) -> list[KnowledgeUserModel]:
-        knowledge_bases = await self.get_knowledge_bases(db=db)
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
-
-        result = []
-        for knowledge_base in knowledge_bases:
-            if knowledge_base.user_id == user_id:
-                result.append(knowledge_base)
-            elif await AccessGrants.has_access(
-                user_id=user_id,
+        async with get_async_db_context(db) as db:
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
+
+            # Owner-or-grant check runs in SQL so inaccessible knowledge bases are never loaded
+            stmt = AccessGrants.has_permission_filter(
+                db=db,
+                query=select(Knowledge),
+                DocumentModel=Knowledge,
+                filter={'user_id': user_id, 'group_ids': user_group_ids},
                 resource_type='knowledge',
-                resource_id=knowledge_base.id,
                 permission=permission,
-                user_group_ids=user_group_ids,
-                db=db,
-            ):
-                result.append(knowledge_base)
-        return result
+            )
+            result = await db.execute(stmt.order_by(Knowledge.updated_at.desc()))
+            return await self._to_knowledge_user_models(result.scalars().all(), db=db)
 
     async def get_knowledge_by_id(self, id: str, db: Optional[AsyncSession] = None) -> Optional[KnowledgeModel]:
         try:
@@ -503,8 +523,7 @@ class KnowledgeTable:
         if knowledge.user_id == user_id:
             return knowledge
 
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
         if await AccessGrants.has_access(
             user_id=user_id,
             resource_type='knowledge',
@@ -704,6 +723,52 @@ class KnowledgeTable:
             except Exception:
                 return None
 
+    async def add_files_to_knowledge_by_ids(
+        self,
+        knowledge_id: str,
+        file_ids: list[str],
+        user_id: str,
+        directory_ids: Optional[dict[str, Optional[str]]] = None,
+        db: Optional[AsyncSession] = None,
+    ) -> None:
+        """Link several files to a knowledge base in a single transaction."""
+        if not file_ids:
+            return
+        directory_ids = directory_ids or {}
+        async with get_async_db_context(db) as db:
+            now = int(time.time())
+            try:
+                db.add_all(
+                    [
+                        KnowledgeFile(
+                            id=str(uuid.uuid4()),
+                            knowledge_id=knowledge_id,
+                            file_id=file_id,
+                            directory_id=directory_ids.get(file_id),
+                            user_id=user_id,
+                            created_at=now,
+                            updated_at=now,
+                        )
+                        for file_id in file_ids
+                    ]
+                )
+                await db.commit()
+                return
+            except Exception as e:
+                await db.rollback()
+                log.debug(f'Batch knowledge file insert failed, falling back to per-file inserts: {e}')
+
+            # A single conflicting row (e.g. a concurrent add of the same file) would fail the
+            # whole batch; insert individually so the remaining files are still linked.
+            for file_id in file_ids:
+                await self.add_file_to_knowledge_by_id(
+                    knowledge_id=knowledge_id,
+                    file_id=file_id,
+                    user_id=user_id,
+                    directory_id=directory_ids.get(file_id),
+                    db=db,
+                )
+
     async def has_file(self, knowledge_id: str, file_id: str, db: Optional[AsyncSession] = None) -> bool:
         """Check whether a file belongs to a knowledge base."""
         try:
@@ -715,6 +780,21 @@ class KnowledgeTable:
         except Exception:
             return False
 
+    async def get_existing_file_ids(
+        self, knowledge_id: str, file_ids: list[str], db: Optional[AsyncSession] = None
+    ) -> set[str]:
+        """Return which of the given file ids already belong to a knowledge base, in one query."""
+        if not file_ids:
+            return set()
+        async with get_async_db_context(db) as db:
+            result = await db.execute(
+                select(KnowledgeFile.file_id).filter(
+                    KnowledgeFile.knowledge_id == knowledge_id,
+                    KnowledgeFile.file_id.in_(file_ids),
+                )
+            )
+            return {row[0] for row in result.all()}
+
     async def remove_file_from_knowledge_by_id(
         self, knowledge_id: str, file_id: str, db: Optional[AsyncSession] = None
     ) -> bool:
@@ -726,6 +806,34 @@ class KnowledgeTable:
         except Exception:
             return False
 
+    async def remove_files_from_knowledge_by_ids(
+        self, knowledge_id: str, file_ids: list[str], db: Optional[AsyncSession] = None
+    ) -> bool:
+        if not file_ids:
+            return True
+
+        try:
+            async with get_async_db_context(db) as db:
+                await db.execute(
+                    delete(KnowledgeFile).filter(
+                        KnowledgeFile.knowledge_id == knowledge_id,
+                        KnowledgeFile.file_id.in_(file_ids),
+                    )
+                )
+                await db.commit()
+                return True
+        except Exception:
+            return False
+
+    async def remove_file_from_all_knowledge(self, file_id: str, db: Optional[AsyncSession] = None) -> bool:
+        try:
+            async with get_async_db_context(db) as db:
+                await db.execute(delete(KnowledgeFile).filter_by(file_id=file_id))
+                await db.commit()
+                return True
+        except Exception:
+            return False
+
     async def reset_knowledge_by_id(
         self, id: str, include_directories: bool = True, db: Optional[AsyncSession] = None
     ) -> Optional[KnowledgeModel]:
@@ -825,10 +933,7 @@ class KnowledgeTable:
     async def delete_all_knowledge(self, db: Optional[AsyncSession] = None) -> bool:
         async with get_async_db_context(db) as db:
             try:
-                result = await db.execute(select(Knowledge.id))
-                knowledge_ids = [row[0] for row in result.all()]
-                for knowledge_id in knowledge_ids:
-                    await AccessGrants.revoke_all_access('knowledge', knowledge_id, db=db)
+                await AccessGrants.revoke_all_access_by_resource_type('knowledge', db=db)
                 await db.execute(delete(Knowledge))
                 await db.commit()
 
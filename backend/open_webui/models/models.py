@@ -152,11 +152,13 @@ class ModelsTable:
         access_grants: list[AccessGrantModel | None] = None,
         db: AsyncSession | None = None,
     ) -> ModelModel:
-        model_data = ModelModel.model_validate(model).model_dump(exclude={'access_grants'})
-        model_data['access_grants'] = (
-            access_grants if access_grants is not None else await self._get_access_grants(model_data['id'], db=db)
+        # Validate the row once; grants are already AccessGrantModel instances
+        # and don't need a second dump/validate round-trip.
+        model_model = ModelModel.model_validate(model)
+        model_model.access_grants = (
+            access_grants if access_grants is not None else await self._get_access_grants(model_model.id, db=db)
         )
-        return ModelModel.model_validate(model_data)
+        return model_model
 
     async def insert_new_model(
         self, form_data: ModelForm, user_id: str, db: AsyncSession | None = None
@@ -198,36 +200,53 @@ class ModelsTable:
                     log.error('Skipping model %r during get_all_models due to error: %s', model.id, exc)
             return models
 
-    async def get_models(self, db: AsyncSession | None = None) -> list[ModelUserResponse]:
-        async with get_async_db_context(db) as db:
-            result = await db.execute(select(Model).filter(Model.base_model_id != None))
-            all_models = result.scalars().all()
-
-            user_ids = list(set(model.user_id for model in all_models))
-            model_ids = [model.id for model in all_models]
+    async def get_models_referencing_id(self, id: str, db: AsyncSession | None = None) -> list[ModelModel]:
+        """Return candidate models whose meta mentions the given knowledge or file id.
 
-            users = await Users.get_users_by_user_ids(user_ids, db=db) if user_ids else []
-            users_dict = {user.id: user for user in users}
+        This is a coarse text match on the serialized meta column so only
+        a handful of rows are loaded; callers still check meta.knowledge.
+        """
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(Model).filter(cast(Model.meta, String).like(f'%{json.dumps(id)}%')))
+            candidate_models = result.scalars().all()
+            model_ids = [model.id for model in candidate_models]
             grants_map = await AccessGrants.get_grants_by_resources('model', model_ids, db=db)
+            return [
+                await self._to_model_model(model, access_grants=grants_map.get(model.id, []), db=db)
+                for model in candidate_models
+            ]
 
-            models = []
-            for model in all_models:
-                user = users_dict.get(model.user_id)
-                models.append(
-                    ModelUserResponse.model_validate(
-                        {
-                            **(
-                                await self._to_model_model(
-                                    model,
-                                    access_grants=grants_map.get(model.id, []),
-                                    db=db,
-                                )
-                            ).model_dump(),
-                            'user': user.model_dump() if user else None,
-                        }
-                    )
+    async def get_models(self, db: AsyncSession | None = None) -> list[ModelUserResponse]:
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(Model).filter(Model.base_model_id != None))
+            return await self._to_model_user_responses(result.scalars().all(), db=db)
+
+    async def _to_model_user_responses(self, all_models, db: AsyncSession) -> list[ModelUserResponse]:
+        user_ids = list(set(model.user_id for model in all_models))
+        model_ids = [model.id for model in all_models]
+
+        users = await Users.get_users_by_user_ids(user_ids, db=db) if user_ids else []
+        users_dict = {user.id: user for user in users}
+        grants_map = await AccessGrants.get_grants_by_resources('model', model_ids, db=db)
+
+        models = []
+        for model in all_models:
+            user = users_dict.get(model.user_id)
+            models.append(
+                ModelUserResponse.model_validate(
+                    {
+                        **(
+                            await self._to_model_model(
+                                model,
+                                access_grants=grants_map.get(model.id, []),
+                                db=db,
+                            )
+                        ).model_dump(),
+                        'user': user.model_dump() if user else None,
+                    }
                 )
-            return models
+            )
+        return models
 
     @staticmethod
     def _meta_has_tag(meta: dict | None, tag: str) -> bool:
@@ -241,9 +260,32 @@ class ModelsTable:
 
         return False
 
+    @staticmethod
+    def _meta_tag_clause(db: AsyncSession, tag: str):
+        """Coarse SQL match of a tag name against the serialized meta column."""
+        # SQLite stores JSON text via json.dumps(ensure_ascii=True),
+        # so non-ASCII chars are \uXXXX-escaped. PostgreSQL native JSONB
+        # stores literal Unicode. Use the right pattern for each.
+        if db.bind.dialect.name == 'sqlite':
+            if tag.isascii():
+                meta_text = func.lower(cast(Model.meta, String))
+                pattern = f'%{json.dumps(tag.lower())}%'
+            else:
+                meta_text = cast(Model.meta, String)
+                pattern = f'%{json.dumps(tag)}%'
+        else:
+            meta_text = func.lower(cast(Model.meta, String))
+            pattern = f'%{json.dumps(tag.lower(), ensure_ascii=False)}%'
+        return meta_text.like(pattern)
+
     async def get_base_models(self, tag: str | None = None, db: AsyncSession | None = None) -> list[ModelModel]:
         async with get_async_db_context(db) as db:
-            result = await db.execute(select(Model).filter(Model.base_model_id.is_(None)))
+            stmt = select(Model).filter(Model.base_model_id.is_(None))
+            if tag:
+                # Narrow in SQL first so only candidate rows are loaded;
+                # the exact tag-name match below still decides membership.
+                stmt = stmt.filter(self._meta_tag_clause(db, tag))
+            result = await db.execute(stmt)
             all_models = result.scalars().all()
             if tag:
                 all_models = [model for model in all_models if self._meta_has_tag(model.meta, tag)]
@@ -258,24 +300,20 @@ class ModelsTable:
     async def get_models_by_user_id(
         self, user_id: str, permission: str = 'write', db: AsyncSession | None = None
     ) -> list[ModelUserResponse]:
-        models = await self.get_models(db=db)
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
-
-        result = []
-        for model in models:
-            if model.user_id == user_id:
-                result.append(model)
-            elif await AccessGrants.has_access(
-                user_id=user_id,
+        async with get_async_db_context(db) as db:
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
+
+            # Owner-or-grant check runs in SQL so inaccessible models are never loaded
+            stmt = AccessGrants.has_permission_filter(
+                db=db,
+                query=select(Model).filter(Model.base_model_id != None),
+                DocumentModel=Model,
+                filter={'user_id': user_id, 'group_ids': user_group_ids},
                 resource_type='model',
-                resource_id=model.id,
                 permission=permission,
-                user_group_ids=user_group_ids,
-                db=db,
-            ):
-                result.append(model)
-        return result
+            )
+            result = await db.execute(stmt)
+            return await self._to_model_user_responses(result.scalars().all(), db=db)
 
     def _has_permission(self, db, query, filter: dict, permission: str = 'read'):
         return AccessGrants.has_permission_filter(
@@ -328,20 +366,7 @@ class ModelsTable:
 
                 tag = filter.get('tag')
                 if tag:
-                    # SQLite stores JSON text via json.dumps(ensure_ascii=True),
-                    # so non-ASCII chars are \uXXXX-escaped. PostgreSQL native JSONB
-                    # stores literal Unicode. Use the right pattern for each.
-                    if db.bind.dialect.name == 'sqlite':
-                        if tag.isascii():
-                            meta_text = func.lower(cast(Model.meta, String))
-                            pattern = f'%{json.dumps(tag.lower())}%'
-                        else:
-                            meta_text = cast(Model.meta, String)
-                            pattern = f'%{json.dumps(tag)}%'
-                    else:
-                        meta_text = func.lower(cast(Model.meta, String))
-                        pattern = f'%{json.dumps(tag.lower(), ensure_ascii=False)}%'
-                    stmt = stmt.filter(meta_text.like(pattern))
+                    stmt = stmt.filter(self._meta_tag_clause(db, tag))
 
                 order_by = filter.get('order_by')
                 direction = filter.get('direction')
@@ -397,6 +422,12 @@ class ModelsTable:
 
             return ModelListResponse(items=models, total=total)
 
+    async def get_active_model_names(self, db: AsyncSession | None = None) -> list:
+        """Return (id, name) rows for active models, skipping access grant resolution."""
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(Model.id, Model.name).filter(Model.is_active.is_(True)))
+            return result.all()
+
     async def get_model_meta_by_id(self, id: str, db: AsyncSession | None = None) -> tuple[dict, int | None]:
         """Return (meta, updated_at) for a model, skipping access grant resolution."""
         try:
@@ -420,8 +451,7 @@ class ModelsTable:
             )
 
             if not is_admin:
-                user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-                user_group_ids = [group.id for group in user_groups]
+                user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
                 filter_dict = {'user_id': user_id}
                 if user_group_ids:
@@ -535,10 +565,7 @@ class ModelsTable:
     async def delete_all_models(self, db: AsyncSession | None = None) -> bool:
         try:
             async with get_async_db_context(db) as db:
-                result = await db.execute(select(Model.id))
-                model_ids = [row[0] for row in result.all()]
-                for model_id in model_ids:
-                    await AccessGrants.revoke_all_access('model', model_id, db=db)
+                await AccessGrants.revoke_all_access_by_resource_type('model', db=db)
                 await db.execute(delete(Model))
                 await db.commit()
 
@@ -583,10 +610,10 @@ class ModelsTable:
                     await AccessGrants.set_access_grants('model', model.id, model.access_grants, db=db)
 
                 # Remove models that are no longer present
-                for model in existing_models:
-                    if model.id not in new_model_ids:
-                        await AccessGrants.revoke_all_access('model', model.id, db=db)
-                        await db.delete(model)
+                removed_model_ids = [model.id for model in existing_models if model.id not in new_model_ids]
+                if removed_model_ids:
+                    await AccessGrants.revoke_all_access_by_resources('model', removed_model_ids, db=db)
+                    await db.execute(delete(Model).filter(Model.id.in_(removed_model_ids)))
 
                 await db.commit()
 
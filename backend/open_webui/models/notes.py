@@ -271,8 +271,7 @@ class NoteTable:
         db: Optional[AsyncSession] = None,
     ) -> list[NoteModel]:
         async with get_async_db_context(db) as db:
-            user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-            user_group_ids = [group.id for group in user_groups]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             stmt = select(Note).order_by(Note.updated_at.desc())
             stmt = self._has_permission(db, stmt, {'user_id': user_id, 'group_ids': user_group_ids}, permission)
@@ -354,8 +353,7 @@ class NoteTable:
         db: Optional[AsyncSession] = None,
     ) -> list[NoteModel]:
         async with get_async_db_context(db) as db:
-            user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-            user_group_ids = [group.id for group in user_groups]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=db)
 
             stmt = (
                 select(Note)
@@ -258,6 +258,22 @@ class OAuthSessionTable:
             log.error(f'Error getting OAuth sessions by user ID: {e}')
             return []
 
+    async def get_session_ids_by_user_id_and_provider(
+        self, user_id: str, provider: str, db: Optional[AsyncSession] = None
+    ) -> list[str]:
+        """Get a user's session IDs for one provider, newest first, without decrypting tokens"""
+        try:
+            async with get_async_db_context(db) as db:
+                result = await db.execute(
+                    select(OAuthSession.id)
+                    .filter_by(user_id=user_id, provider=provider)
+                    .order_by(OAuthSession.created_at.desc())
+                )
+                return list(result.scalars().all())
+        except Exception as e:
+            log.error(f'Error getting OAuth session IDs by user ID and provider: {e}')
+            return []
+
     async def update_session_by_id(
         self, session_id: str, token: dict, db: Optional[AsyncSession] = None
     ) -> Optional[OAuthSessionModel]:
@@ -306,6 +322,19 @@ class OAuthSessionTable:
             log.error(f'Error deleting OAuth session: {e}')
             return False
 
+    async def delete_sessions_by_ids(self, session_ids: list[str], db: Optional[AsyncSession] = None) -> bool:
+        """Delete several OAuth sessions in a single statement"""
+        if not session_ids:
+            return True
+        try:
+            async with get_async_db_context(db) as db:
+                await db.execute(delete(OAuthSession).filter(OAuthSession.id.in_(session_ids)))
+                await db.commit()
+                return True
+        except Exception as e:
+            log.error(f'Error deleting OAuth sessions: {e}')
+            return False
+
     async def delete_sessions_by_user_id(self, user_id: str, db: Optional[AsyncSession] = None) -> bool:
         """Delete all OAuth sessions for a user"""
         try:
@@ -243,8 +243,7 @@ class PromptsTable:
         self, user_id: str, permission: str = 'write', db: AsyncSession | None = None
     ) -> list[PromptUserResponse]:
         async with get_async_db_context(db) as session:
-            user_groups = await Groups.get_groups_by_member_id(user_id, db=session)
-            user_group_ids = [group.id for group in user_groups]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=session)
 
             query = select(Prompt).filter(Prompt.is_active == True).order_by(Prompt.updated_at.desc())
             query = AccessGrants.has_permission_filter(
@@ -695,8 +694,7 @@ class PromptsTable:
     async def get_tags_by_user_id(self, user_id: str, db: AsyncSession | None = None) -> list[str]:
         try:
             async with get_async_db_context(db) as session:
-                user_groups = await Groups.get_groups_by_member_id(user_id, db=session)
-                user_group_ids = [group.id for group in user_groups]
+                user_group_ids = await Groups.get_group_ids_by_member_id(user_id, db=session)
 
                 query = select(Prompt.tags).filter(Prompt.is_active == True)
                 query = AccessGrants.has_permission_filter(
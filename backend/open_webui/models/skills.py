@@ -199,8 +199,7 @@ class SkillsTable:
         self, user_id: str, permission: str = 'write', db: Optional[AsyncSession] = None
     ) -> list[SkillUserModel]:
         skills = await self.get_skills(db=db)
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
 
         result = []
         for skill in skills:
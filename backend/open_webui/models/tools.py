@@ -169,6 +169,12 @@ class ToolsTable:
                 for tool in tools
             }
 
+    async def get_tool_names(self, db: AsyncSession | None = None) -> list:
+        """Return (id, name) rows for all tools, skipping content, owner and access grant resolution."""
+        async with get_async_db_context(db) as db:
+            result = await db.execute(select(Tool.id, Tool.name))
+            return result.all()
+
     async def get_tools(self, defer_content: bool = False, db: AsyncSession | None = None) -> list[ToolUserModel]:
         async with get_async_db_context(db) as db:
             stmt = select(Tool).order_by(Tool.updated_at.desc())
@@ -211,8 +217,7 @@ class ToolsTable:
         db: AsyncSession | None = None,
     ) -> list[ToolUserModel]:
         tools = await self.get_tools(defer_content=defer_content, db=db)
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
 
         result = []
         for tool in tools:
@@ -695,11 +695,11 @@ class UsersTable:
         from open_webui.models.chats import Chats
         from open_webui.models.groups import Groups
 
-        # Remove User from Groups
-        await Groups.remove_user_from_all_groups(id)
-
-        # Delete User Chats
         async with get_async_db_context(db) as session:
+            # Remove User from Groups
+            await Groups.remove_user_from_all_groups(id, db=session)
+
+            # Delete User Chats
             deleted_chats = await Chats.delete_chats_by_user_id(id, db=session)
             if not deleted_chats:
                 return False  # chats deletion failed
@@ -735,8 +735,8 @@ class UsersTable:
 
     async def get_valid_user_ids(self, user_ids: list[str], db: AsyncSession | None = None) -> list[str]:
         async with get_async_db_context(db) as session:
-            result = await session.execute(select(User).where(User.id.in_(user_ids)))
-            return [u.id for u in result.scalars().all()]
+            result = await session.execute(select(User.id).where(User.id.in_(user_ids)))
+            return list(result.scalars().all())
 
     async def get_super_admin_user(self, db: AsyncSession | None = None) -> UserModel | None:
         async with get_async_db_context(db) as session:
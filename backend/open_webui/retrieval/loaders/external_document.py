@@ -34,9 +34,6 @@ class ExternalDocumentLoader(BaseLoader):
         self.metadata = metadata
 
     def load(self) -> List[Document]:
-        with open(self.file_path, 'rb') as f:
-            data = f.read()
-
         headers = {}
         if self.mime_type is not None:
             headers['Content-Type'] = self.mime_type
@@ -58,11 +55,13 @@ class ExternalDocumentLoader(BaseLoader):
         if url.endswith('/'):
             url = url[:-1]
 
-        try:
-            response = requests.put(f'{url}/process', data=data, headers=headers)
-        except Exception as e:
-            log.error(f'Error connecting to endpoint: {e}')
-            raise Exception(f'Error connecting to endpoint: {e}')
+        # Stream the file body instead of buffering the whole document in memory
+        with open(self.file_path, 'rb') as f:
+            try:
+                response = requests.put(f'{url}/process', data=f, headers=headers)
+            except Exception as e:
+                log.error(f'Error connecting to endpoint: {e}')
+                raise Exception(f'Error connecting to endpoint: {e}')
 
         if response.ok:
             response_data = response.json()
@@ -1,9 +1,11 @@
+import asyncio
 import logging
-from typing import Iterator, List, Union
+from typing import AsyncIterator, Iterator, List, Union
 
 import requests
 from langchain_core.document_loaders import BaseLoader
 from langchain_core.documents import Document
+from open_webui.utils.session_pool import get_session
 
 log = logging.getLogger(__name__)
 
@@ -15,37 +17,87 @@ class ExternalWebLoader(BaseLoader):
         external_url: str,
         external_api_key: str,
         continue_on_failure: bool = True,
+        batch_size: int = 20,
+        max_concurrent_batches: int = 8,
         **kwargs,
     ) -> None:
         self.external_url = external_url
         self.external_api_key = external_api_key
         self.urls = web_paths if isinstance(web_paths, list) else [web_paths]
         self.continue_on_failure = continue_on_failure
+        self.batch_size = max(1, batch_size)
+        self.max_concurrent_batches = max_concurrent_batches
+
+    def _get_headers(self) -> dict:
+        return {
+            'User-Agent': 'Open WebUI (https://github.com/open-webui/open-webui) External Web Loader',
+            'Authorization': f'Bearer {self.external_api_key}',
+        }
+
+    def _fetch_batch(self, session: requests.Session, urls: List[str]) -> List[dict]:
+        response = session.post(
+            self.external_url,
+            headers=self._get_headers(),
+            json={
+                'urls': urls,
+            },
+        )
+        response.raise_for_status()
+        # Parsed here so the response and its raw body are released before anything is yielded
+        return response.json()
 
     def lazy_load(self) -> Iterator[Document]:
-        batch_size = 20
-        for i in range(0, len(self.urls), batch_size):
-            urls = self.urls[i : i + batch_size]
+        # Reuse one keep-alive connection to the extractor across batches
+        with requests.Session() as session:
+            for i in range(0, len(self.urls), self.batch_size):
+                urls = self.urls[i : i + self.batch_size]
+                try:
+                    for result in self._fetch_batch(session, urls):
+                        yield Document(
+                            page_content=result.get('page_content', ''),
+                            metadata=result.get('metadata', {}),
+                        )
+                except Exception as e:
+                    if self.continue_on_failure:
+                        log.error(f'Error extracting content from batch {urls}: {e}')
+                    else:
+                        raise e
+
+    async def _afetch_batch(self, session, semaphore: asyncio.Semaphore, urls: List[str]) -> List[dict]:
+        async with semaphore:
             try:
-                response = requests.post(
+                async with session.post(
                     self.external_url,
-                    headers={
-                        'User-Agent': 'Open WebUI (https://github.com/open-webui/open-webui) External Web Loader',
-                        'Authorization': f'Bearer {self.external_api_key}',
-                    },
+                    headers=self._get_headers(),
                     json={
                         'urls': urls,
                     },
-                )
-                response.raise_for_status()
-                results = response.json()
-                for result in results:
+                ) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except Exception as e:
+                if self.continue_on_failure:
+                    log.error(f'Error extracting content from batch {urls}: {e}')
+                    return []
+                raise e
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        # Batches are independent, so dispatch them concurrently (bounded by
+        # max_concurrent_batches) and yield each batch as soon as it lands.
+        # The shared pool is closed once on application shutdown, never here.
+        session = await get_session()
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_batches))
+        tasks = [
+            asyncio.ensure_future(self._afetch_batch(session, semaphore, self.urls[i : i + self.batch_size]))
+            for i in range(0, len(self.urls), self.batch_size)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                for result in await task:
                     yield Document(
                         page_content=result.get('page_content', ''),
                         metadata=result.get('metadata', {}),
                     )
-            except Exception as e:
-                if self.continue_on_failure:
-                    log.error(f'Error extracting content from batch {urls}: {e}')
-                else:
-                    raise e
+        finally:
+            for task in tasks:
+                task.cancel()
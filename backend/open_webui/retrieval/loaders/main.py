@@ -146,9 +146,6 @@ class TikaLoader:
         self.extract_images = extract_images
 
     def load(self) -> list[Document]:
-        with open(self.file_path, 'rb') as f:
-            data = f.read()
-
         if self.mime_type is not None:
             headers = {'Content-Type': self.mime_type}
         else:
@@ -162,7 +159,9 @@ class TikaLoader:
             endpoint += '/'
         endpoint += 'tika/text'
 
-        r = requests.put(endpoint, data=data, headers=headers, verify=REQUESTS_VERIFY)
+        # Stream the file body instead of buffering the whole document in memory
+        with open(self.file_path, 'rb') as f:
+            r = requests.put(endpoint, data=f, headers=headers, verify=REQUESTS_VERIFY)
 
         if r.ok:
             raw_metadata = r.json()
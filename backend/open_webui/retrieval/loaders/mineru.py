@@ -336,79 +336,81 @@ class MinerULoader:
 
         log.info(f'Polling batch status: {batch_id}')
 
-        for iteration in range(max_iterations):
-            try:
-                response = requests.get(
-                    f'{self.api_url}/extract-results/batch/{batch_id}',
-                    headers=headers,
-                    timeout=30,
-                )
-                response.raise_for_status()
-            except requests.HTTPError as e:
-                error_detail = f'Failed to poll batch status: {e}'
-                if e.response is not None:
-                    try:
-                        error_data = e.response.json()
-                        error_detail += f' - {error_data.get("msg", error_data)}'
-                    except Exception:
-                        error_detail += f' - {e.response.text}'
-                raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=error_detail)
-            except Exception as e:
-                raise HTTPException(
-                    status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f'Error polling batch status: {str(e)}',
-                )
+        # Polls hit the same host repeatedly; a session keeps the connection alive between them
+        with requests.Session() as session:
+            session.headers.update(headers)
+            for iteration in range(max_iterations):
+                try:
+                    response = session.get(
+                        f'{self.api_url}/extract-results/batch/{batch_id}',
+                        timeout=30,
+                    )
+                    response.raise_for_status()
+                except requests.HTTPError as e:
+                    error_detail = f'Failed to poll batch status: {e}'
+                    if e.response is not None:
+                        try:
+                            error_data = e.response.json()
+                            error_detail += f' - {error_data.get("msg", error_data)}'
+                        except Exception:
+                            error_detail += f' - {e.response.text}'
+                    raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=error_detail)
+                except Exception as e:
+                    raise HTTPException(
+                        status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        detail=f'Error polling batch status: {str(e)}',
+                    )
 
-            try:
-                result = response.json()
-            except ValueError as e:
-                raise HTTPException(
-                    status.HTTP_502_BAD_GATEWAY,
-                    detail=f'Invalid JSON response while polling: {e}',
-                )
+                try:
+                    result = response.json()
+                except ValueError as e:
+                    raise HTTPException(
+                        status.HTTP_502_BAD_GATEWAY,
+                        detail=f'Invalid JSON response while polling: {e}',
+                    )
 
-            # Check for API error response
-            if result.get('code') != 0:
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    detail=f'MinerU Cloud API error: {result.get("msg", "Unknown error")}',
-                )
+                # Check for API error response
+                if result.get('code') != 0:
+                    raise HTTPException(
+                        status.HTTP_400_BAD_REQUEST,
+                        detail=f'MinerU Cloud API error: {result.get("msg", "Unknown error")}',
+                    )
 
-            data = result.get('data', {})
-            extract_result = data.get('extract_result', [])
+                data = result.get('data', {})
+                extract_result = data.get('extract_result', [])
 
-            # Find our file in the batch results
-            file_result = None
-            for item in extract_result:
-                if item.get('file_name') == filename:
-                    file_result = item
-                    break
+                # Find our file in the batch results
+                file_result = None
+                for item in extract_result:
+                    if item.get('file_name') == filename:
+                        file_result = item
+                        break
 
-            if not file_result:
-                raise HTTPException(
-                    status.HTTP_502_BAD_GATEWAY,
-                    detail=f'File {filename} not found in batch results',
-                )
+                if not file_result:
+                    raise HTTPException(
+                        status.HTTP_502_BAD_GATEWAY,
+                        detail=f'File {filename} not found in batch results',
+                    )
 
-            state = file_result.get('state')
+                state = file_result.get('state')
 
-            if state == 'done':
-                log.info(f'Processing complete for {filename}')
-                return file_result
-            elif state == 'failed':
-                error_msg = file_result.get('err_msg', 'Unknown error')
-                raise HTTPException(
-                    status.HTTP_400_BAD_REQUEST,
-                    detail=f'MinerU processing failed: {error_msg}',
-                )
-            elif state in ['waiting-file', 'pending', 'running', 'converting']:
-                # Still processing
-                if iteration % 10 == 0:  # Log every 20 seconds
-                    log.info(f'Processing status: {state} (iteration {iteration + 1}/{max_iterations})')
-                time.sleep(poll_interval)
-            else:
-                log.warning(f'Unknown state: {state}')
-                time.sleep(poll_interval)
+                if state == 'done':
+                    log.info(f'Processing complete for {filename}')
+                    return file_result
+                elif state == 'failed':
+                    error_msg = file_result.get('err_msg', 'Unknown error')
+                    raise HTTPException(
+                        status.HTTP_400_BAD_REQUEST,
+                        detail=f'MinerU processing failed: {error_msg}',
+                    )
+                elif state in ['waiting-file', 'pending', 'running', 'converting']:
+                    # Still processing
+                    if iteration % 10 == 0:  # Log every 20 seconds
+                        log.info(f'Processing status: {state} (iteration {iteration + 1}/{max_iterations})')
+                    time.sleep(poll_interval)
+                else:
+                    log.warning(f'Unknown state: {state}')
+                    time.sleep(poll_interval)
 
         # Timeout
         raise HTTPException(
@@ -23,8 +23,10 @@ class ColBERT(BaseReranker):
             # /root/.cache/torch_extensions/py311_cpu/segmented_maxsim_cpp/segmented_maxsim_cpp.so: cannot open shared object file: No such file or directory
 
             lock_file = '/root/.cache/torch_extensions/py311_cpu/segmented_maxsim_cpp/lock'
-            if os.path.exists(lock_file):
+            try:
                 os.remove(lock_file)
+            except FileNotFoundError:
+                pass
 
         self.ckpt = Checkpoint(
             name,
@@ -255,8 +255,8 @@ CHUNK_HASH_KEY = '_chunk_hash'
 
 
 def _content_hash(text: str) -> str:
-    """SHA-256 hash of text, used as a stable chunk identifier for RRF dedup."""
-    return hashlib.sha256(text.encode()).hexdigest()
+    """BLAKE2b-128 hash of text, used as a stable chunk identifier for RRF dedup."""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
 
 
 class VectorSearchRetriever(BaseRetriever):
@@ -1566,14 +1566,14 @@ async def get_sources_from_items(
         if query_result is None and collection_names:
             collection_names = set(collection_names).difference(extracted_collections)
             if not collection_names:
-                log.debug(f'skipping {item} as it has already been extracted')
+                log.debug('skipping %s as it has already been extracted', item)
                 continue
 
             # Filter out collections the user cannot read
             if user:
                 collection_names = await filter_accessible_collections(collection_names, user)
                 if not collection_names:
-                    log.debug(f'access denied for all collections in item {item}')
+                    log.debug('access denied for all collections in item %s', item)
                     continue
 
             try:
@@ -53,6 +53,7 @@ their own `asyncio.to_thread`, e.g. ::
 from __future__ import annotations
 
 import asyncio
+import logging
 from typing import Dict, List, Optional, Union
 
 from open_webui.retrieval.vector.factory import VECTOR_DB_CLIENT
@@ -63,6 +64,8 @@ from open_webui.retrieval.vector.main import (
     VectorItem,
 )
 
+log = logging.getLogger(__name__)
+
 
 class AsyncVectorDBClient:
     """Awaitable mirror of `VectorDBBase` that off-loads each call to a thread.
@@ -92,6 +95,43 @@ class AsyncVectorDBClient:
     async def delete_collection(self, collection_name: str) -> None:
         return await asyncio.to_thread(self._sync.delete_collection, collection_name)
 
+    def _delete_collection_if_exists(self, collection_name: str) -> bool:
+        if not self._sync.has_collection(collection_name):
+            return False
+        self._sync.delete_collection(collection_name)
+        return True
+
+    async def delete_collection_if_exists(self, collection_name: str) -> bool:
+        """Delete a collection if present, probing and deleting in one worker-thread hop.
+
+        Not part of `VectorDBBase`. Returns whether a collection was deleted;
+        backend errors other than absence still propagate.
+        """
+        return await asyncio.to_thread(self._delete_collection_if_exists, collection_name)
+
+    async def delete_collections(self, collection_names: List[str], max_concurrency: int = 3) -> None:
+        """Delete several collections, a few at a time.
+
+        Not part of `VectorDBBase`; missing collections are skipped and a
+        failure on one name does not stop the rest. Each delete is a
+        latency-bound round trip on remote backends, so up to
+        `max_concurrency` run in parallel; the cap stays low so the
+        vector DB is not flooded with concurrent drops.
+        """
+        if not collection_names:
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _delete_collection(collection_name: str) -> None:
+            async with semaphore:
+                try:
+                    await asyncio.to_thread(self._delete_collection_if_exists, collection_name)
+                except Exception as e:
+                    log.debug(f'Failed to delete collection {collection_name}: {e}')
+
+        await asyncio.gather(*(_delete_collection(collection_name) for collection_name in collection_names))
+
     async def insert(self, collection_name: str, items: List[VectorItem]) -> None:
         return await asyncio.to_thread(self._sync.insert, collection_name, items)
 
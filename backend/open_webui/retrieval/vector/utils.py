@@ -4,7 +4,8 @@ from typing import Any
 from open_webui.retrieval.vector.main import SearchResult
 from open_webui.utils.misc import sanitize_text_for_db
 
-KEYS_TO_EXCLUDE = ['content', 'pages', 'tables', 'paragraphs', 'sections', 'figures']
+# Checked for every metadata key of every chunk written to the vector store, so keep lookups O(1)
+KEYS_TO_EXCLUDE = frozenset({'content', 'pages', 'tables', 'paragraphs', 'sections', 'figures'})
 
 
 def filter_metadata(metadata: dict[str, any]) -> dict[str, any]:
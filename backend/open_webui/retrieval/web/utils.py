@@ -3,9 +3,10 @@ import ipaddress
 import logging
 import socket
 import ssl
+import time
 import urllib.parse
 import urllib.request
-from datetime import datetime, time, timedelta
+from datetime import datetime, timedelta
 from typing import (
     Any,
     AsyncIterator,
@@ -32,6 +33,7 @@ from langchain_core.documents import Document
 from open_webui.config import (
     ENABLE_LOCAL_WEB_FETCH,
     EXTERNAL_WEB_LOADER_API_KEY,
+    EXTERNAL_WEB_LOADER_BATCH_SIZE,
     EXTERNAL_WEB_LOADER_URL,
     FIRECRAWL_API_BASE_URL,
     FIRECRAWL_API_KEY,
@@ -906,6 +908,7 @@ def get_web_loader(
         WebLoaderClass = ExternalWebLoader
         web_loader_args['external_url'] = EXTERNAL_WEB_LOADER_URL
         web_loader_args['external_api_key'] = EXTERNAL_WEB_LOADER_API_KEY
+        web_loader_args['batch_size'] = EXTERNAL_WEB_LOADER_BATCH_SIZE
 
     if WebLoaderClass:
         web_loader = WebLoaderClass(**web_loader_args)
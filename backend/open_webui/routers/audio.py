@@ -75,6 +75,10 @@ AZURE_MAX_FILE_SIZE: int = AZURE_MAX_FILE_SIZE_MB * 1024 * 1024
 SPEECH_CACHE_DIR = CACHE_DIR / 'audio' / 'speech'
 SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+TRANSCRIPTIONS_CACHE_DIR = CACHE_DIR / 'audio' / 'transcriptions'
+TRANSCRIPTIONS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+TRANSCRIPTIONS_CACHE_REALPATH = os.path.realpath(TRANSCRIPTIONS_CACHE_DIR)
+
 TTS_CONFIG_KEYS = {
     'OPENAI_API_BASE_URL': 'audio.tts.openai.api_base_url',
     'OPENAI_API_KEY': 'audio.tts.openai.api_key',
@@ -1179,12 +1183,10 @@ async def transcription(
         filename = f'{id}.{ext}'
         contents = await file.read()
 
-        file_dir = os.path.join(CACHE_DIR, 'audio', 'transcriptions')
-        os.makedirs(file_dir, exist_ok=True)
-        file_path = os.path.join(file_dir, filename)
+        file_path = os.path.join(TRANSCRIPTIONS_CACHE_DIR, filename)
 
         # Defense-in-depth: ensure resolved path stays within intended directory
-        if not os.path.realpath(file_path).startswith(os.path.realpath(file_dir)):
+        if not os.path.realpath(file_path).startswith(TRANSCRIPTIONS_CACHE_REALPATH):
             raise ValueError('Invalid file path detected')
 
         def _write_upload():
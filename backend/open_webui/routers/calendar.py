@@ -1,5 +1,6 @@
 import logging
 import time
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
@@ -66,8 +67,7 @@ async def _check_calendar_access(calendar_id: str, user: UserModel, permission:
         raise HTTPException(status_code=404, detail='Calendar not found')
     if cal.user_id == user.id or user.role == 'admin':
         return cal
-    user_groups = await Groups.get_groups_by_member_id(user.id)
-    user_group_ids = [g.id for g in user_groups]
+    user_group_ids = await Groups.get_group_ids_by_member_id(user.id)
     if await AccessGrants.has_access(
         user_id=user.id,
         resource_type='calendar',
@@ -160,7 +160,6 @@ async def get_events(
     - Virtual events computed from active automation RRULEs (Scheduled Tasks calendar)
     """
     await check_calendar_permission(request, user)
-    from datetime import datetime
 
     try:
         start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
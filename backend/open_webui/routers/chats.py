@@ -886,11 +886,42 @@ async def get_all_user_tags(user=Depends(get_verified_user), db: AsyncSession =
 ############################
 
 
+async def generate_all_chats_json():
+    """
+    Async generator that streams every chat in the database as one JSON array.
+
+    Chats are read in id-keyed batches with short-lived DB sessions, so only one
+    batch is held in memory, no lock is kept for the whole export, and chats
+    updated mid-export are neither skipped nor duplicated. A chat that fails to
+    serialize aborts the stream rather than being silently left out.
+    """
+    last_id = None
+    separator = ''
+
+    yield '['
+    while True:
+        chats = await Chats.get_chats_after(last_id=last_id, limit=CHAT_EXPORT_BATCH_SIZE, db=None)
+        for chat in chats:
+            try:
+                item = ChatResponse(**chat.model_dump()).model_dump_json()
+            except Exception:
+                log.exception('Error serializing chat %s, aborting export', chat.id)
+                raise
+            yield separator + item
+            separator = ','
+
+        if len(chats) < CHAT_EXPORT_BATCH_SIZE:
+            break
+
+        last_id = chats[-1].id
+    yield ']'
+
+
 @router.get('/all/db', response_model=list[ChatResponse])
-async def get_all_user_chats_in_db(user=Depends(get_admin_user), db: AsyncSession = Depends(get_async_session)):
+async def get_all_user_chats_in_db(user=Depends(get_admin_user)):
     if not ENABLE_ADMIN_EXPORT:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail=ERROR_MESSAGES.ACCESS_PROHIBITED)
-    return [ChatResponse(**chat.model_dump()) for chat in await Chats.get_chats(db=db)]
+    return StreamingResponse(generate_all_chats_json(), media_type='application/json')
 
 
 ############################
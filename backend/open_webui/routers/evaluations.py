@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
@@ -138,7 +139,6 @@ def _get_top_tags(feedbacks: list[LeaderboardFeedbackData], limit: int = 5) -> d
 
     Returns: {model_id: [{"tag": str, "count": int}, ...]}
     """
-    from collections import defaultdict
 
     tag_counts = defaultdict(lambda: defaultdict(int))
 
@@ -340,10 +340,7 @@ async def export_all_feedbacks(
     user=Depends(get_admin_user),
     db: AsyncSession = Depends(get_async_session),
 ):
-    feedbacks = await Feedbacks.get_all_feedbacks(db=db)
-    if model_id:
-        feedbacks = [f for f in feedbacks if f.data and f.data.get('model_id') == model_id]
-    return feedbacks
+    return await Feedbacks.get_all_feedbacks(model_id=model_id, db=db)
 
 
 PAGE_ITEM_COUNT = 30
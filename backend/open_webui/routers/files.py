@@ -604,7 +604,7 @@ async def get_file_process_status(
                 for _ in range(MAX_FILE_PROCESSING_DURATION):
                     file_item = await Files.get_file_by_id(file_id)  # Creates own session
                     if file_item:
-                        data = file_item.model_dump().get('data', {})
+                        data = file_item.data or {}
                         status = data.get('status')
 
                         if status:
@@ -982,9 +982,10 @@ async def delete_file_by_id(
     if file.user_id == user.id or user.role == 'admin' or await has_access_to_file(id, 'write', user, db=db):
         # Clean up KB associations and embeddings before deleting
         knowledges = await Knowledges.get_knowledges_by_file_id(id, db=db)
-        for knowledge in knowledges:
-            # Remove KB-file relationship
-            await Knowledges.remove_file_from_knowledge_by_id(knowledge.id, id, db=db)
+        # Remove every KB-file relationship in one statement
+        await Knowledges.remove_file_from_all_knowledge(id, db=db)
+
+        async def remove_kb_embeddings(knowledge):
             # Clean KB embeddings (same logic as /knowledge/{id}/file/remove)
             try:
                 await ASYNC_VECTOR_DB_CLIENT.delete(collection_name=knowledge.id, filter={'file_id': id})
@@ -993,18 +994,22 @@ async def delete_file_by_id(
             except Exception as e:
                 log.debug(f'KB embedding cleanup for {knowledge.id}: {e}')
 
+        # Each KB lives in its own collection, so the cleanups are independent
+        await asyncio.gather(*(remove_kb_embeddings(knowledge) for knowledge in knowledges))
+
         result = await Files.delete_file_by_id(id, db=db)
         if result:
+            # The row is gone, so storage and vector cleanup are best-effort and
+            # independent: a missing blob or collection must not fail the request
+            # or skip the other cleanup.
             try:
                 await asyncio.to_thread(Storage.delete_file, file.path)
-                await ASYNC_VECTOR_DB_CLIENT.delete(collection_name=f'file-{id}')
             except Exception as e:
-                log.exception(e)
-                log.error('Error deleting files')
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=ERROR_MESSAGES.DEFAULT('Error deleting files'),
-                )
+                log.warning(f'Failed to delete stored file for {id}: {e}')
+            try:
+                await ASYNC_VECTOR_DB_CLIENT.delete_collection_if_exists(f'file-{id}')
+            except Exception as e:
+                log.warning(f'Failed to delete vector collection for file {id}: {e}')
             await publish_event(
                 request,
                 EVENTS.FILE_DELETED,
@@ -186,6 +186,7 @@ async def get_shared_folders(
 
     # Filter out folders owned by the user
     results = []
+    shared_roots = []
     owner_cache = {}
     for folder_id, permission in folder_perms.items():
         folder = await Folders.get_folder_by_id(folder_id, db=db)
@@ -197,6 +198,7 @@ async def get_shared_folders(
             owner = await Users.get_user_by_id(folder.user_id, db=db)
             owner_cache[folder.user_id] = owner.name if owner else 'Unknown'
 
+        shared_roots.append(folder)
         results.append(
             {
                 **folder.model_dump(),
@@ -205,22 +207,22 @@ async def get_shared_folders(
             }
         )
 
-    # Also include child folders of shared folders (inheritance)
-    shared_root_ids = {r['id'] for r in results}
-    for root_id in list(shared_root_ids):
-        root_folder = await Folders.get_folder_by_id(root_id, db=db)
-        if root_folder:
-            children = await Folders.get_children_folders_by_id_and_user_id(root_id, root_folder.user_id, db=db)
-            if children:
-                for child in children:
-                    if child.id not in {r['id'] for r in results}:
-                        results.append(
-                            {
-                                **child.model_dump(),
-                                'owner_name': owner_cache.get(child.user_id, 'Unknown'),
-                                'permission': folder_perms.get(root_id, 'read'),
-                            }
-                        )
+    # Also include child folders of shared folders (inheritance).
+    # The roots fetched above are reused and the seen-id set is kept up to
+    # date instead of being rebuilt from results for every child.
+    seen_ids = {r['id'] for r in results}
+    for root_folder in shared_roots:
+        children = await Folders.get_children_folders_by_id_and_user_id(root_folder.id, root_folder.user_id, db=db)
+        for child in children or []:
+            if child.id not in seen_ids:
+                seen_ids.add(child.id)
+                results.append(
+                    {
+                        **child.model_dump(),
+                        'owner_name': owner_cache.get(child.user_id, 'Unknown'),
+                        'permission': folder_perms.get(root_folder.id, 'read'),
+                    }
+                )
 
     return results
 
@@ -576,14 +578,14 @@ async def delete_folder_by_id(
             try:
                 folder_ids = await Folders.delete_folder_by_id_and_user_id(folder.id, folder_owner_id, db=db)
 
-                for folder_id in folder_ids:
-                    if delete_contents:
-                        await Chats.delete_chats_by_user_id_and_folder_id(folder_owner_id, folder_id, db=db)
-                    else:
-                        await Chats.move_chats_by_user_id_and_folder_id(folder_owner_id, folder_id, None, db=db)
+                # Handle chats for the whole subtree in one statement set
+                if delete_contents:
+                    await Chats.delete_chats_by_user_id_and_folder_ids(folder_owner_id, folder_ids, db=db)
+                else:
+                    await Chats.move_chats_by_user_id_and_folder_ids(folder_owner_id, folder_ids, None, db=db)
 
-                    # Clean up access grants for this folder
-                    await AccessGrants.revoke_all_access('folder', folder_id, db=db)
+                # Clean up access grants for the whole subtree
+                await AccessGrants.revoke_all_access_by_resources('folder', folder_ids, db=db)
 
                 await publish_event(
                     request,
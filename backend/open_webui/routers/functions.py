@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 from pathlib import Path
 from typing import Optional
 
@@ -25,6 +24,7 @@ from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.plugin import (
     get_functions_cache,
     get_function_module_from_cache,
+    github_url_to_raw_url,
     load_function_module_by_id,
     replace_imports,
     resolve_valves_schema_options,
@@ -77,23 +77,6 @@ class LoadUrlForm(BaseModel):
     url: HttpUrl
 
 
-def github_url_to_raw_url(url: str) -> str:
-    # Handle 'tree' (folder) URLs (add main.py at the end)
-    m1 = re.match(r'https://github\.com/([^/]+)/([^/]+)/tree/([^/]+)/(.*)', url)
-    if m1:
-        org, repo, branch, path = m1.groups()
-        return f'https://raw.githubusercontent.com/{org}/{repo}/refs/heads/{branch}/{path.rstrip("/")}/main.py'
-
-    # Handle 'blob' (file) URLs
-    m2 = re.match(r'https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)', url)
-    if m2:
-        org, repo, branch, path = m2.groups()
-        return f'https://raw.githubusercontent.com/{org}/{repo}/refs/heads/{branch}/{path}'
-
-    # No match; return as-is
-    return url
-
-
 @router.post('/load/url', response_model=dict | None)
 async def load_function_from_url(request: Request, form_data: LoadUrlForm, user=Depends(get_admin_user)):
     # NOTE: This is NOT a SSRF vulnerability:
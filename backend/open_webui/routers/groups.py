@@ -352,17 +352,17 @@ async def preview_group_access(
     group_ids = {group.id}
 
     # Batch-check accessible resources using existing AccessGrants
-    all_models = await Models.get_all_models(db=db)
+    active_models = await Models.get_active_model_names(db=db)
     accessible_model_ids = await AccessGrants.get_accessible_resource_ids(
         user_id='',
         resource_type='model',
-        resource_ids=[m.id for m in all_models],
+        resource_ids=[m.id for m in active_models],
         permission='read',
         user_group_ids=group_ids,
         db=db,
     )
 
-    all_knowledge = await Knowledges.get_knowledge_bases(db=db)
+    all_knowledge = await Knowledges.get_knowledge_names(db=db)
     accessible_knowledge_ids = await AccessGrants.get_accessible_resource_ids(
         user_id='',
         resource_type='knowledge',
@@ -372,7 +372,7 @@ async def preview_group_access(
         db=db,
     )
 
-    all_tools = await Tools.get_tools(defer_content=True, db=db)
+    all_tools = await Tools.get_tool_names(db=db)
     accessible_tool_ids = await AccessGrants.get_accessible_resource_ids(
         user_id='',
         resource_type='tool',
@@ -382,8 +382,6 @@ async def preview_group_access(
         db=db,
     )
 
-    active_models = [m for m in all_models if m.is_active]
-
     return {
         'group': {'id': group.id, 'name': group.name},
         'models': {
@@ -10,12 +10,13 @@ import zipfile
 from typing import List, Optional
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
 from open_webui.config import BYPASS_ADMIN_ACCESS_CONTROL
 from open_webui.constants import ERROR_MESSAGES
+from open_webui.env import REDIS_KEY_PREFIX
 from open_webui.events import EVENTS, publish_event
-from open_webui.internal.db import get_async_session
+from open_webui.internal.db import get_async_db_context, get_async_session
 from open_webui.models.access_grants import AccessGrants
 from open_webui.models.config import Config
 from open_webui.models.files import FileMetadataResponse, FileModel, FileModelResponse, Files
@@ -63,6 +64,10 @@ PAGE_ITEM_COUNT = 30
 # stored here find the ones who need it.
 KNOWLEDGE_BASES_COLLECTION = 'knowledge-bases'
 
+# Cap on concurrent per-file deletes during sync cleanup; kept low so
+# object stores and vector DBs are not flooded with parallel requests.
+SYNC_CLEANUP_CONCURRENCY = 3
+
 
 async def embed_knowledge_base_metadata(
     request: Request,
@@ -137,12 +142,11 @@ async def get_knowledge_bases(
     skip = (page - 1) * limit
 
     filter = {}
-    groups = await Groups.get_groups_by_member_id(user.id, db=db)
-    user_group_ids = {group.id for group in groups}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     if not user.role == 'admin' or not BYPASS_ADMIN_ACCESS_CONTROL:
-        if groups:
-            filter['group_ids'] = [group.id for group in groups]
+        if user_group_ids:
+            filter['group_ids'] = list(user_group_ids)
 
         filter['user_id'] = user.id
 
@@ -196,12 +200,11 @@ async def search_knowledge_bases(
     if source in {'local', 'external'}:
         filter['source'] = source
 
-    groups = await Groups.get_groups_by_member_id(user.id, db=db)
-    user_group_ids = {group.id for group in groups}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     if not user.role == 'admin' or not BYPASS_ADMIN_ACCESS_CONTROL:
-        if groups:
-            filter['group_ids'] = [group.id for group in groups]
+        if user_group_ids:
+            filter['group_ids'] = list(user_group_ids)
 
         filter['user_id'] = user.id
 
@@ -252,9 +255,9 @@ async def search_knowledge_files(
     if include_content:
         filter['include_content'] = True
 
-    groups = await Groups.get_groups_by_member_id(user.id, db=db)
-    if groups:
-        filter['group_ids'] = [group.id for group in groups]
+    group_ids = await Groups.get_group_ids_by_member_id(user.id, db=db)
+    if group_ids:
+        filter['group_ids'] = group_ids
 
     filter['user_id'] = user.id
 
@@ -322,22 +325,43 @@ async def create_new_knowledge(
 ############################
 
 
-@router.post('/reindex', response_model=bool)
-async def reindex_knowledge_files(
-    request: Request,
-    user=Depends(get_verified_user),
-    db: AsyncSession = Depends(get_async_session),
-):
-    if user.role != 'admin':
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=ERROR_MESSAGES.UNAUTHORIZED,
-        )
+# Guards against two admins (or two clicks) starting overlapping reindex runs,
+# which would re-embed every file twice. Redis makes the guard cluster-wide;
+# without it the flag only covers this worker.
+KNOWLEDGE_REINDEX_LOCK_KEY = f'{REDIS_KEY_PREFIX}:knowledge:reindex_lock'
+KNOWLEDGE_REINDEX_LOCK_TIMEOUT = 6 * 60 * 60
+_knowledge_reindex_running = False
+
+
+async def _acquire_reindex_lock(request: Request) -> bool:
+    global _knowledge_reindex_running
+    redis = request.app.state.redis
+    if redis is not None:
+        return bool(await redis.set(KNOWLEDGE_REINDEX_LOCK_KEY, '1', nx=True, ex=KNOWLEDGE_REINDEX_LOCK_TIMEOUT))
+    if _knowledge_reindex_running:
+        return False
+    _knowledge_reindex_running = True
+    return True
+
 
-    knowledge_bases = await Knowledges.get_knowledge_bases(db=db)
+async def _release_reindex_lock(request: Request) -> None:
+    global _knowledge_reindex_running
+    redis = request.app.state.redis
+    if redis is not None:
+        await redis.delete(KNOWLEDGE_REINDEX_LOCK_KEY)
+    _knowledge_reindex_running = False
+
+
+async def _reindex_knowledge_files(request: Request, user) -> None:
+    """Re-embed every knowledge base file. Runs as a background task.
+
+    NOTE: Each file is processed in its own short-lived session rather than
+    the request session, which is already closed by the time this runs and
+    would otherwise be held across many embedding calls.
+    """
+    knowledge_bases = await Knowledges.get_knowledge_bases()
     knowledge_base_files = [
-        (knowledge_base, await Knowledges.get_files_by_id(knowledge_base.id, db=db))
-        for knowledge_base in knowledge_bases
+        (knowledge_base, await Knowledges.get_files_by_id(knowledge_base.id)) for knowledge_base in knowledge_bases
     ]
     total_files = sum(len(files) for _, files in knowledge_base_files)
     processed_files = 0
@@ -349,8 +373,7 @@ async def reindex_knowledge_files(
     for kb_idx, (knowledge_base, files) in enumerate(knowledge_base_files, start=1):
         try:
             try:
-                if await ASYNC_VECTOR_DB_CLIENT.has_collection(collection_name=knowledge_base.id):
-                    await ASYNC_VECTOR_DB_CLIENT.delete_collection(collection_name=knowledge_base.id)
+                await ASYNC_VECTOR_DB_CLIENT.delete_collection_if_exists(knowledge_base.id)
             except Exception as e:
                 log.error(f'Error deleting collection {knowledge_base.id}: {str(e)}')
                 continue  # Skip, don't raise
@@ -369,12 +392,13 @@ async def reindex_knowledge_files(
                 )
 
                 try:
-                    await process_file(
-                        request,
-                        ProcessFileForm(file_id=file.id, collection_name=knowledge_base.id),
-                        user=user,
-                        db=db,
-                    )
+                    async with get_async_db_context() as db_session:
+                        await process_file(
+                            request,
+                            ProcessFileForm(file_id=file.id, collection_name=knowledge_base.id),
+                            user=user,
+                            db=db_session,
+                        )
                 except Exception as e:
                     log.error(f'Error processing file {file.filename} (ID: {file.id}): {str(e)}')
                     failed_files.append({'file_id': file.id, 'error': str(e)})
@@ -398,6 +422,35 @@ async def reindex_knowledge_files(
         subject_id='all',
         data={'count': len(knowledge_bases)},
     )
+
+
+@router.post('/reindex', response_model=bool)
+async def reindex_knowledge_files(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    user=Depends(get_verified_user),
+):
+    if user.role != 'admin':
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ERROR_MESSAGES.UNAUTHORIZED,
+        )
+
+    if not await _acquire_reindex_lock(request):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=ERROR_MESSAGES.DEFAULT('Knowledge reindexing is already in progress'),
+        )
+
+    async def run_reindex():
+        try:
+            await _reindex_knowledge_files(request, user)
+        finally:
+            await _release_reindex_lock(request)
+
+    # Reindexing can take many minutes; respond right away instead of
+    # holding the request (and a DB session) open until it finishes.
+    background_tasks.add_task(run_reindex)
     return True
 
 
@@ -418,12 +471,12 @@ async def reindex_knowledge_base_metadata_embeddings(
     for each one, making N external embedding API calls. Holding a session during
     this entire operation would exhaust the connection pool.
     """
-    knowledge_bases = await Knowledges.get_knowledge_bases()
+    knowledge_bases = await Knowledges.get_knowledge_summaries()
     log.info(f'Reindexing embeddings for {len(knowledge_bases)} knowledge bases')
 
     success_count = 0
-    for kb in knowledge_bases:
-        if await embed_knowledge_base_metadata(request, kb.id, kb.name, kb.description):
+    for kb_id, kb_name, kb_description in knowledge_bases:
+        if await embed_knowledge_base_metadata(request, kb_id, kb_name, kb_description):
             success_count += 1
 
     log.info(f'Embedding reindex complete: {success_count}/{len(knowledge_bases)}')
@@ -615,11 +668,7 @@ async def _get_external_connection(id: str) -> Optional[dict]:
 
 
 async def _count_external_connection_mappings(connection_id: str, db: Optional[AsyncSession] = None) -> int:
-    count = 0
-    for knowledge in await Knowledges.get_knowledge_bases(db=db):
-        if (knowledge.meta or {}).get('external', {}).get('connection_id') == connection_id:
-            count += 1
-    return count
+    return await Knowledges.count_knowledge_by_external_connection_id(connection_id, db=db)
 
 
 @router.get('/external/connections', response_model=ExternalKnowledgeConnectionListResponse)
@@ -1615,8 +1664,7 @@ async def remove_file_from_knowledge_by_id(
         try:
             # Remove the file's collection from vector database
             file_collection = f'file-{form_data.file_id}'
-            if await ASYNC_VECTOR_DB_CLIENT.has_collection(collection_name=file_collection):
-                await ASYNC_VECTOR_DB_CLIENT.delete_collection(collection_name=file_collection)
+            await ASYNC_VECTOR_DB_CLIENT.delete_collection_if_exists(file_collection)
         except Exception as e:
             log.debug('This was most likely caused by bypassing embedding processing')
             log.debug(e)
@@ -1682,8 +1730,8 @@ async def delete_knowledge_by_id(
 
     log.info(f'Deleting knowledge base: {id} (name: {knowledge.name})')
 
-    # Get all models
-    models = await Models.get_all_models(db=db)
+    # Only load models whose meta mentions this knowledge base
+    models = await Models.get_models_referencing_id(id, db=db)
     log.info(f'Found {len(models)} models to check for knowledge base {id}')
 
     # Update models that reference this knowledge base
@@ -1931,33 +1979,49 @@ async def sync_knowledge_cleanup(
     await _verify_knowledge_write_access(id, user, db)
 
     # ── Remove deleted files ──
-    for file_id in form_data.file_ids:
-        file = await Files.get_file_by_id(file_id, db=db)
-        if not file:
-            continue
+    # Fetch, unlink and delete the DB rows in batches. The per-file
+    # collections, the shared-collection vectors and the storage objects
+    # each still need one latency-bound call per file, so they run
+    # concurrently, at most SYNC_CLEANUP_CONCURRENCY at a time.
+    files = await Files.get_files_by_ids(form_data.file_ids, db=db) if form_data.file_ids else []
+    await Knowledges.remove_files_from_knowledge_by_ids(id, [file.id for file in files], db=db)
 
-        await Knowledges.remove_file_from_knowledge_by_id(id, file_id, db=db)
-
-        try:
-            await ASYNC_VECTOR_DB_CLIENT.delete(collection_name=id, filter={'file_id': file_id})
-            await ASYNC_VECTOR_DB_CLIENT.delete(collection_name=id, filter={'hash': file.hash})
-        except Exception:
-            pass
+    semaphore = asyncio.Semaphore(SYNC_CLEANUP_CONCURRENCY)
 
-        try:
-            collection_name = f'file-{file_id}'
-            if await ASYNC_VECTOR_DB_CLIENT.has_collection(collection_name):
-                await ASYNC_VECTOR_DB_CLIENT.delete_collection(collection_name)
-        except Exception:
-            pass
+    async def delete_file_vectors(file):
+        async with semaphore:
+            try:
+                await ASYNC_VECTOR_DB_CLIENT.delete(collection_name=id, filter={'file_id': file.id})
+                await ASYNC_VECTOR_DB_CLIENT.delete(collection_name=id, filter={'hash': file.hash})
+            except Exception:
+                pass
 
-        if file.user_id == user.id or user.role == 'admin':
-            await Files.delete_file_by_id(file_id, db=db)
+    async def delete_file_storage(file):
+        async with semaphore:
             try:
                 await asyncio.to_thread(Storage.delete_file, file.path)
             except Exception:
                 pass
 
+    async def remove_vectors():
+        await asyncio.gather(*(delete_file_vectors(file) for file in files))
+        await ASYNC_VECTOR_DB_CLIENT.delete_collections(
+            [f'file-{file.id}' for file in files], max_concurrency=SYNC_CLEANUP_CONCURRENCY
+        )
+
+    async def remove_owned_files():
+        if user.role == 'admin':
+            owned_files = files
+        else:
+            user_id = user.id
+            owned_files = [file for file in files if file.user_id == user_id]
+        await Files.delete_files_by_ids([file.id for file in owned_files], db=db)
+        await asyncio.gather(*(delete_file_storage(file) for file in owned_files))
+
+    # Vector cleanup never touches the DB session, so it can overlap with
+    # the row deletes and storage removals; only remove_owned_files uses db.
+    await asyncio.gather(remove_vectors(), remove_owned_files())
+
     # ── Remove orphaned directories (children before parents) ──
     for dir_id in reversed(form_data.dir_ids):
         await Knowledges.delete_directory(dir_id, move_files_to_parent=False, db=db)
@@ -2031,10 +2095,8 @@ async def add_files_to_knowledge_batch(
 
     # Filter out files already linked to this knowledge base to prevent
     # duplicate embeddings in the vector DB (issue #10679).
-    new_entries = []
-    for form in form_data:
-        if not await Knowledges.has_file(knowledge_id=id, file_id=form.file_id, db=db):
-            new_entries.append(form)
+    existing_file_ids = await Knowledges.get_existing_file_ids(id, file_ids, db=db)
+    new_entries = [form for form in form_data if form.file_id not in existing_file_ids]
 
     if not new_entries:
         return KnowledgeFilesResponse(
@@ -2061,14 +2123,13 @@ async def add_files_to_knowledge_batch(
     # Only add files that were successfully processed
     successful_file_ids = [r.file_id for r in result.results if r.status == 'completed']
     dir_map = {form.file_id: form.directory_id for form in new_entries}
-    for file_id in successful_file_ids:
-        await Knowledges.add_file_to_knowledge_by_id(
-            knowledge_id=id,
-            file_id=file_id,
-            user_id=user.id,
-            directory_id=dir_map.get(file_id),
-            db=db,
-        )
+    await Knowledges.add_files_to_knowledge_by_ids(
+        knowledge_id=id,
+        file_ids=successful_file_ids,
+        user_id=user.id,
+        directory_ids=dir_map,
+        db=db,
+    )
 
     # If there were any errors, include them in the response
     if result.errors:
@@ -400,7 +400,7 @@ async def reset_memory_from_vector_db(
     """
     await check_memories_permission(user)
 
-    await ASYNC_VECTOR_DB_CLIENT.delete_collection(f'user-memory-{user.id}')
+    await ASYNC_VECTOR_DB_CLIENT.delete_collection_if_exists(f'user-memory-{user.id}')
 
     memories = await Memories.get_memories_by_user_id(user.id)
 
@@ -453,7 +453,7 @@ async def delete_memory_by_user_id(
 
     if result:
         try:
-            await ASYNC_VECTOR_DB_CLIENT.delete_collection(f'user-memory-{user.id}')
+            await ASYNC_VECTOR_DB_CLIENT.delete_collection_if_exists(f'user-memory-{user.id}')
         except Exception as e:
             log.error(e)
         await publish_event(
@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import asyncio
 import base64
 import io
-import json
 import logging
 import posixpath
-from typing import Optional
 from urllib.parse import unquote
 
 from fastapi import (
@@ -30,7 +27,6 @@ from open_webui.models.models import (
     ModelAccessListResponse,
     ModelAccessResponse,
     ModelForm,
-    ModelListResponse,
     ModelMeta,
     ModelModel,
     ModelParams,
@@ -148,12 +144,11 @@ async def get_models(
         filter['direction'] = direction
 
     # Pre-fetch user group IDs once - used for both filter and write_access check
-    groups = await Groups.get_groups_by_member_id(user.id, db=db)
-    user_group_ids = {group.id for group in groups}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     if not user.role == 'admin' or not BYPASS_ADMIN_ACCESS_CONTROL:
-        if groups:
-            filter['group_ids'] = [group.id for group in groups]
+        if user_group_ids:
+            filter['group_ids'] = list(user_group_ids)
 
         filter['user_id'] = user.id
 
@@ -365,8 +360,7 @@ async def import_models(
             # per-model has_access calls (N+1 avoidance).
             existing_model_ids = list(existing_models.keys())
             if user.role != 'admin' and existing_model_ids:
-                groups = await Groups.get_groups_by_member_id(user.id, db=db)
-                user_group_ids = {group.id for group in groups}
+                user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
                 writable_model_ids = await AccessGrants.get_accessible_resource_ids(
                     user_id=user.id,
                     resource_type='model',
@@ -500,23 +494,27 @@ class ModelIdForm(BaseModel):
 async def get_model_by_id(id: str, user=Depends(get_verified_user), db: AsyncSession = Depends(get_async_session)):
     model = await Models.get_model_by_id(id, db=db)
     if model:
-        write_access = (
-            (user.role == 'admin' and BYPASS_ADMIN_ACCESS_CONTROL)
-            or user.id == model.user_id
-            or await AccessGrants.has_access(
+        write_access = (user.role == 'admin' and BYPASS_ADMIN_ACCESS_CONTROL) or user.id == model.user_id
+
+        # Resolve group membership once for both the write and read checks
+        user_group_ids = None
+        if not write_access:
+            user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
+            write_access = await AccessGrants.has_access(
                 user_id=user.id,
                 resource_type='model',
                 resource_id=model.id,
                 permission='write',
+                user_group_ids=user_group_ids,
                 db=db,
             )
-        )
 
         if write_access or await AccessGrants.has_access(
             user_id=user.id,
             resource_type='model',
             resource_id=model.id,
             permission='read',
+            user_group_ids=user_group_ids,
             db=db,
         ):
             model_dict = model.model_dump()
@@ -183,9 +183,9 @@ async def search_notes(
         filter['direction'] = direction
 
     if not user.role == 'admin' or not BYPASS_ADMIN_ACCESS_CONTROL:
-        groups = await Groups.get_groups_by_member_id(user.id, db=db)
-        if groups:
-            filter['group_ids'] = [group.id for group in groups]
+        group_ids = await Groups.get_group_ids_by_member_id(user.id, db=db)
+        if group_ids:
+            filter['group_ids'] = group_ids
 
         filter['user_id'] = user.id
 
@@ -418,7 +418,7 @@ async def get_filtered_models(models, user, db=None):
     """Return only the models the given *user* is allowed to access."""
     model_ids = [m['model'] for m in models.get('models', [])]
     model_infos = {mi.id: mi for mi in await Models.get_models_by_ids(model_ids, db=db)}
-    user_group_ids = {g.id for g in await Groups.get_groups_by_member_id(user.id, db=db)}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     accessible_ids = await AccessGrants.get_accessible_resource_ids(
         user_id=user.id,
@@ -685,7 +685,7 @@ async def create_model(
     if not await Config.get('ollama.enable'):
         raise HTTPException(status_code=503, detail=ERROR_MESSAGES.OLLAMA_API_DISABLED)
 
-    log.debug(f'form_data: {form_data}')
+    log.debug('form_data: %s', form_data)
     url = (await Config.get('ollama.base_urls', []))[url_idx]
 
     return await send_request(
@@ -1406,7 +1406,7 @@ async def get_openai_models(
     if user.role == 'user' and not BYPASS_MODEL_ACCESS_CONTROL:
         model_ids = [m['id'] for m in models]
         model_infos = {mi.id: mi for mi in await Models.get_models_by_ids(model_ids, db=db)}
-        user_group_ids = {g.id for g in await Groups.get_groups_by_member_id(user.id, db=db)}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
         accessible_ids = await AccessGrants.get_accessible_resource_ids(
             user_id=user.id,
             resource_type='model',
@@ -1450,7 +1450,10 @@ async def download_file_stream(
     chunk_size: int = 1024 * 1024,
 ):
     """Stream a model file download from *file_url*, then push the blob to Ollama."""
-    current_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+    try:
+        current_size = os.stat(file_path).st_size
+    except FileNotFoundError:
+        current_size = 0
     headers = {'Range': f'bytes={current_size}-'} if current_size > 0 else {}
 
     session = await get_session()
@@ -1489,7 +1492,8 @@ async def download_file_stream(
                     timeout=aiohttp.ClientTimeout(total=30),
                 ) as blob_resp:
                     if blob_resp.ok:
-                        os.remove(file_path)
+                        # Model files run to gigabytes; unlinking them can block for a while
+                        await asyncio.to_thread(os.remove, file_path)
                         yield f'data: {json.dumps({"done": done, "blob": f"sha256:{hashed}", "name": file_name})}\n\n'
                     else:
                         raise RuntimeError('Ollama: Could not create blob, Please try again.')
@@ -1587,7 +1591,7 @@ async def upload_model(
                     raise Exception('Ollama: Could not create blob, Please try again.')
 
             log.info('Uploaded to /api/blobs')
-            os.remove(file_path)
+            await asyncio.to_thread(os.remove, file_path)
 
             # Stage 4: create the model
             model, _ext = os.path.splitext(filename)
@@ -76,6 +76,10 @@ log = logging.getLogger(__name__)
 # in ZlibError.  See https://github.com/aio-libs/aiohttp/issues/4462.
 _STRIP_PROXY_HEADERS = frozenset({'Content-Encoding', 'Content-Length', 'Transfer-Encoding'})
 
+_AZURE_V1_URL_RE = re.compile(r'/openai/v1(?:/|$)')
+_O_SERIES_MODEL_RE = re.compile(r'^o\d+')
+_GPT_MAJOR_VERSION_RE = re.compile(r'^gpt-(\d+)')
+
 
 def _clean_proxy_headers(raw_headers) -> dict:
     """Return a copy of *raw_headers* with stale encoding headers removed."""
@@ -241,6 +245,9 @@ router = APIRouter()
 LLAMACPP_LOADED_STATES = {'loaded', 'sleeping'}
 LLAMACPP_UNLOADED_STATES = {'loading', 'unloaded'}
 
+SPEECH_CACHE_DIR = CACHE_DIR / 'audio' / 'speech'
+SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
 
 def get_llamacpp_model_loaded_state(model: dict, provider: str, manual_model_ids: bool = False) -> bool | None:
     if provider != 'llama.cpp':
@@ -370,8 +377,6 @@ async def speech(request: Request, user=Depends(get_verified_user)):
         body = await request.body()
         name = hashlib.sha256(body).hexdigest()
 
-        SPEECH_CACHE_DIR = CACHE_DIR / 'audio' / 'speech'
-        SPEECH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         file_path = SPEECH_CACHE_DIR.joinpath(f'{name}.mp3')
         file_body_path = SPEECH_CACHE_DIR.joinpath(f'{name}.json')
 
@@ -511,7 +516,7 @@ async def get_all_models_responses(request: Request, user: UserModel) -> list:
                 if provider:
                     model['provider'] = provider
 
-    log.debug(f'get_all_models:responses() {responses}')
+    log.debug('get_all_models:responses() %s', responses)
     return responses
 
 
@@ -519,7 +524,7 @@ async def get_filtered_models(models, user, db=None):
     # Filter models based on user access control
     model_ids = [model['id'] for model in models.get('data', [])]
     model_infos = {model_info.id: model_info for model_info in await Models.get_models_by_ids(model_ids, db=db)}
-    user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id, db=db)}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     # Batch-fetch accessible resource IDs in a single query instead of N has_access calls
     accessible_model_ids = await AccessGrants.get_accessible_resource_ids(
@@ -741,7 +746,7 @@ async def verify_connection(
 
                 # Azure v1 format: base URL already ends with /openai/v1,
                 # use standard /models endpoint without api-version.
-                is_azure_v1 = bool(re.search(r'/openai/v1(?:/|$)', url))
+                is_azure_v1 = bool(_AZURE_V1_URL_RE.search(url))
 
                 if is_azure_v1:
                     verify_url = f'{url.rstrip("/")}/models'
@@ -846,10 +851,10 @@ def get_azure_allowed_params(api_version: str) -> set[str]:
 def is_openai_new_model(model: str) -> bool:
     model_lower = model.lower()
     # o-series models (o1, o3, o4, o5, ...)
-    if re.match(r'^o\d+', model_lower):
+    if _O_SERIES_MODEL_RE.match(model_lower):
         return True
     # gpt-N where N >= 5 (gpt-5, gpt-5.2, gpt-6, ...)
-    m = re.match(r'^gpt-(\d+)', model_lower)
+    m = _GPT_MAJOR_VERSION_RE.match(model_lower)
     if m and int(m.group(1)) >= 5:
         return True
     return False
@@ -1212,7 +1217,7 @@ async def generate_chat_completion(
 
         # Azure v1 format: base URL already ends with /openai/v1,
         # model stays in the payload, no deployment URL rewriting.
-        is_azure_v1 = bool(re.search(r'/openai/v1(?:/|$)', url))
+        is_azure_v1 = bool(_AZURE_V1_URL_RE.search(url))
 
         if is_azure_v1:
             if is_responses:
@@ -1361,7 +1366,7 @@ async def embeddings(request: Request, form_data: dict, user):
 
         # Azure v1 format: base URL already ends with /openai/v1,
         # model stays in the payload, no deployment URL rewriting.
-        is_azure_v1 = bool(re.search(r'/openai/v1(?:/|$)', url))
+        is_azure_v1 = bool(_AZURE_V1_URL_RE.search(url))
 
         if is_azure_v1:
             embeddings_url = f'{url.rstrip("/")}/embeddings'
@@ -1477,7 +1482,7 @@ async def responses(
             if auth_type not in ('azure_ad', 'microsoft_entra_id'):
                 headers['api-key'] = key
 
-            is_azure_v1 = bool(re.search(r'/openai/v1(?:/|$)', url))
+            is_azure_v1 = bool(_AZURE_V1_URL_RE.search(url))
 
             if is_azure_v1:
                 request_url = f'{url.rstrip("/")}/responses'
@@ -1582,7 +1587,7 @@ async def proxy(path: str, request: Request, user=Depends(get_verified_user)):
             if auth_type not in ('azure_ad', 'microsoft_entra_id'):
                 headers['api-key'] = key
 
-            is_azure_v1 = bool(re.search(r'/openai/v1(?:/|$)', url))
+            is_azure_v1 = bool(_AZURE_V1_URL_RE.search(url))
 
             if is_azure_v1:
                 qs = request.url.query
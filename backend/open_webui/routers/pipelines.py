@@ -2,6 +2,7 @@ import asyncio
 import logging
 import os
 import shutil
+import tempfile
 from typing import Optional
 
 import aiohttp
@@ -233,7 +234,9 @@ async def upload_pipeline(
 
     upload_folder = f'{CACHE_DIR}/pipelines'
     os.makedirs(upload_folder, exist_ok=True)
-    file_path = os.path.join(upload_folder, filename)
+    # Each upload gets its own directory so concurrent uploads of the same filename can't clobber each other
+    upload_dir = tempfile.mkdtemp(dir=upload_folder)
+    file_path = os.path.join(upload_dir, filename)
 
     response = None
     try:
@@ -296,8 +299,7 @@ async def upload_pipeline(
         )
     finally:
         # Ensure the file is deleted after the upload is completed or on failure
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        shutil.rmtree(upload_dir, ignore_errors=True)
 
 
 class AddPipelineForm(BaseModel):
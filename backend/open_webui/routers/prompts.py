@@ -97,12 +97,11 @@ async def get_prompt_list(
         filter['direction'] = direction
 
     # Pre-fetch user group IDs once - used for both filter and write_access check
-    groups = await Groups.get_groups_by_member_id(user.id, db=db)
-    user_group_ids = {group.id for group in groups}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     if not (user.role == 'admin' and BYPASS_ADMIN_ACCESS_CONTROL):
-        if groups:
-            filter['group_ids'] = [group.id for group in groups]
+        if user_group_ids:
+            filter['group_ids'] = list(user_group_ids)
 
         filter['user_id'] = user.id
 
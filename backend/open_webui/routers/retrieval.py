@@ -6,7 +6,6 @@ import logging
 import mimetypes
 import os
 import re
-import shutil
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -43,7 +42,6 @@ from open_webui.config import (
     RAG_EMBEDDING_QUERY_PREFIX,
     RAG_RERANKING_MODEL_AUTO_UPDATE,
     RAG_RERANKING_MODEL_TRUST_REMOTE_CODE,
-    UPLOAD_DIR,
 )
 from open_webui.constants import ERROR_MESSAGES
 from open_webui.env import (
@@ -114,7 +112,7 @@ from open_webui.retrieval.web.yacy import search_yacy
 from open_webui.retrieval.web.yandex import search_yandex
 from open_webui.retrieval.web.ydc import search_youcom
 from open_webui.retrieval.web.linkup import search_linkup
-from open_webui.storage.provider import Storage
+from open_webui.storage.provider import LocalStorageProvider, Storage
 from open_webui.utils.access_control import has_permission
 from open_webui.utils.access_control.files import has_access_to_file
 from open_webui.utils.auth import get_admin_user, get_verified_user
@@ -2907,24 +2905,8 @@ async def reset_vector_db(
 
 @router.post('/reset/uploads')
 async def reset_upload_dir(request: Request, user=Depends(get_admin_user)) -> bool:
-    folder = f'{UPLOAD_DIR}'
-    try:
-        # Check if the directory exists
-        if os.path.exists(folder):
-            # Iterate over all the files and directories in the specified directory
-            for filename in os.listdir(folder):
-                file_path = os.path.join(folder, filename)
-                try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)  # Remove the file or link
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)  # Remove the directory
-                except Exception as e:
-                    log.exception(f'Failed to delete {file_path}. Reason: {e}')
-        else:
-            log.warning(f'The directory {folder} does not exist')
-    except Exception as e:
-        log.exception(f'Failed to process the directory {folder}. Reason: {e}')
+    # Deleting a large upload tree can take a while; keep it off the event loop.
+    await asyncio.to_thread(LocalStorageProvider.delete_all_files)
     await publish_event(
         request,
         EVENTS.RETRIEVAL_UPLOADS_RESET,
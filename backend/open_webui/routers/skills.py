@@ -44,7 +44,7 @@ async def get_skills(
     if user.role == 'admin' and BYPASS_ADMIN_ACCESS_CONTROL:
         skills = await Skills.get_skills(db=db)
     else:
-        user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id, db=db)}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
         all_skills = await Skills.get_skills(db=db)
         skills = [
             skill
@@ -88,9 +88,9 @@ async def get_skill_list(
         filter['view_option'] = view_option
 
     if not (user.role == 'admin' and BYPASS_ADMIN_ACCESS_CONTROL):
-        groups = await Groups.get_groups_by_member_id(user.id, db=db)
-        if groups:
-            filter['group_ids'] = [group.id for group in groups]
+        group_ids = await Groups.get_group_ids_by_member_id(user.id, db=db)
+        if group_ids:
+            filter['group_ids'] = group_ids
 
         filter['user_id'] = user.id
 
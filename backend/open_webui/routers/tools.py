@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import re
 import time
 from pathlib import Path
 from typing import Optional
@@ -34,6 +33,7 @@ from open_webui.utils.auth import get_admin_user, get_verified_user
 from open_webui.utils.plugin import (
     get_tools_cache,
     get_tool_module_from_cache,
+    github_url_to_raw_url,
     load_tool_module_by_id,
     replace_imports,
     resolve_valves_schema_options,
@@ -166,7 +166,7 @@ async def get_tools(
         # Admin can see all tools
         return tools
     else:
-        user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id, db=db)}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
         filtered_tools = []
         for tool in tools:
             if tool.user_id == user.id:
@@ -204,7 +204,7 @@ async def get_tool_list(user=Depends(get_verified_user), db: AsyncSession = Depe
     else:
         tools = await Tools.get_tools_by_user_id(user.id, 'read', defer_content=True, db=db)
 
-    user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id, db=db)}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
     result = []
     for tool in tools:
@@ -238,23 +238,6 @@ class LoadUrlForm(BaseModel):
     url: HttpUrl
 
 
-def github_url_to_raw_url(url: str) -> str:
-    # Handle 'tree' (folder) URLs (add main.py at the end)
-    m1 = re.match(r'https://github\.com/([^/]+)/([^/]+)/tree/([^/]+)/(.*)', url)
-    if m1:
-        org, repo, branch, path = m1.groups()
-        return f'https://raw.githubusercontent.com/{org}/{repo}/refs/heads/{branch}/{path.rstrip("/")}/main.py'
-
-    # Handle 'blob' (file) URLs
-    m2 = re.match(r'https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)', url)
-    if m2:
-        org, repo, branch, path = m2.groups()
-        return f'https://raw.githubusercontent.com/{org}/{repo}/refs/heads/{branch}/{path}'
-
-    # No match; return as-is
-    return url
-
-
 @router.post('/load/url', response_model=dict | None)
 async def load_tool_from_url(request: Request, form_data: LoadUrlForm, user=Depends(get_admin_user)):
     # NOTE: This is NOT a SSRF vulnerability:
@@ -795,17 +795,17 @@ async def get_user_preview(
     user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
     user_group_ids = {g.id for g in user_groups}
 
-    all_models = await Models.get_all_models(db=db)
+    active_models = await Models.get_active_model_names(db=db)
     accessible_model_ids = await AccessGrants.get_accessible_resource_ids(
         user_id=user_id,
         resource_type='model',
-        resource_ids=[m.id for m in all_models],
+        resource_ids=[m.id for m in active_models],
         permission='read',
         user_group_ids=user_group_ids,
         db=db,
     )
 
-    all_knowledge = await Knowledges.get_knowledge_bases(db=db)
+    all_knowledge = await Knowledges.get_knowledge_names(db=db)
     accessible_knowledge_ids = await AccessGrants.get_accessible_resource_ids(
         user_id=user_id,
         resource_type='knowledge',
@@ -815,7 +815,7 @@ async def get_user_preview(
         db=db,
     )
 
-    all_tools = await Tools.get_tools(defer_content=True, db=db)
+    all_tools = await Tools.get_tool_names(db=db)
     accessible_tool_ids = await AccessGrants.get_accessible_resource_ids(
         user_id=user_id,
         resource_type='tool',
@@ -825,8 +825,6 @@ async def get_user_preview(
         db=db,
     )
 
-    active_models = [m for m in all_models if m.is_active]
-
     return {
         'user': {'id': target_user.id, 'name': target_user.name},
         'groups': [{'id': g.id, 'name': g.name} for g in user_groups],
@@ -4,6 +4,7 @@ import os
 import re
 import shutil
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import BinaryIO, Dict, Tuple
 
 import boto3
@@ -85,15 +86,16 @@ class LocalStorageProvider(StorageProvider):
     def delete_all_files() -> None:
         """Handles deletion of all files from local storage."""
         if os.path.exists(UPLOAD_DIR):
-            for filename in os.listdir(UPLOAD_DIR):
-                file_path = os.path.join(UPLOAD_DIR, filename)
-                try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)  # Remove the file or link
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)  # Remove the directory
-                except Exception as e:
-                    log.exception(f'Failed to delete {file_path}. Reason: {e}')
+            # scandir entries carry the file type from the directory listing, avoiding a stat per entry
+            with os.scandir(UPLOAD_DIR) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)  # Remove the directory
+                        else:
+                            os.unlink(entry.path)  # Remove the file or link
+                    except Exception as e:
+                        log.exception(f'Failed to delete {entry.path}. Reason: {e}')
         else:
             log.warning(f'Directory {UPLOAD_DIR} not found in local storage.')
 
@@ -183,14 +185,24 @@ class S3StorageProvider(StorageProvider):
     def delete_all_files(self) -> None:
         """Handles deletion of all files from S3 storage."""
         try:
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
-            if 'Contents' in response:
-                for content in response['Contents']:
-                    # Skip objects that were not uploaded from open-webui in the first place
-                    if not content['Key'].startswith(self.key_prefix):
-                        continue
-
-                    self.s3_client.delete_object(Bucket=self.bucket_name, Key=content['Key'])
+            # Each listed page holds at most 1000 keys, which is also the DeleteObjects limit,
+            # so every page is removed with a single request instead of one request per key.
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.key_prefix):
+                # Skip objects that were not uploaded from open-webui in the first place
+                keys = [
+                    {'Key': content['Key']}
+                    for content in page.get('Contents', [])
+                    if content['Key'].startswith(self.key_prefix)
+                ]
+                if not keys:
+                    continue
+
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name, Delete={'Objects': keys, 'Quiet': True}
+                )
+                for error in response.get('Errors', []):
+                    log.warning(f'Failed to delete {error.get("Key")} from S3: {error.get("Message")}')
         except ClientError as e:
             raise RuntimeError(f'Error deleting all files from S3: {e}')
 
@@ -257,10 +269,13 @@ class GCSStorageProvider(StorageProvider):
     def delete_all_files(self) -> None:
         """Handles deletion of all files from GCS storage."""
         try:
-            blobs = self.bucket.list_blobs()
+            blobs = list(self.bucket.list_blobs())
 
-            for blob in blobs:
-                blob.delete()
+            # GCS batch requests hold at most 100 calls; send deletes in chunks of that size
+            for i in range(0, len(blobs), 100):
+                with self.gcs_client.batch():
+                    for blob in blobs[i : i + 100]:
+                        blob.delete()
 
         except NotFound as e:
             raise RuntimeError(f'Error deleting all files from GCS: {e}')
@@ -321,9 +336,13 @@ class AzureStorageProvider(StorageProvider):
     def delete_all_files(self) -> None:
         """Handles deletion of all files from Azure Blob Storage."""
         try:
-            blobs = self.container_client.list_blobs()
-            for blob in blobs:
-                self.container_client.delete_blob(blob.name)
+            blob_names = [blob.name for blob in self.container_client.list_blobs()]
+
+            # Each delete is a separate round trip; issue them from a pool so one slow
+            # request does not hold up the rest
+            if blob_names:
+                with ThreadPoolExecutor(max_workers=min(16, len(blob_names))) as executor:
+                    list(executor.map(self.container_client.delete_blob, blob_names))
         except Exception as e:
             raise RuntimeError(f'Error deleting all files from Azure Blob Storage: {e}')
 
@@ -941,7 +941,7 @@ async def search_notes(
 
     try:
         user_id = __user__.get('id')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         result = await Notes.search_notes(
             user_id=user_id,
@@ -1038,7 +1038,7 @@ async def view_note(
 
         # Check access permission
         user_id = __user__.get('id')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         from open_webui.models.access_grants import AccessGrants
 
@@ -1151,7 +1151,7 @@ async def replace_note_content(
 
         # Check write permission
         user_id = __user__.get('id')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         from open_webui.models.access_grants import AccessGrants
 
@@ -1654,7 +1654,7 @@ async def list_knowledge_bases(
         from open_webui.models.knowledge import Knowledges
 
         user_id = __user__.get('id')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         result = await Knowledges.search_knowledge_bases(
             user_id,
@@ -1714,7 +1714,7 @@ async def search_knowledge_bases(
         from open_webui.models.knowledge import Knowledges
 
         user_id = __user__.get('id')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         result = await Knowledges.search_knowledge_bases(
             user_id,
@@ -1781,7 +1781,7 @@ async def search_knowledge_files(
 
         user_id = __user__.get('id')
         user_role = __user__.get('role', 'user')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         # When model has attached knowledge, scope to attached KBs/files only
         if __model_knowledge__:
@@ -1956,7 +1956,7 @@ async def grep_knowledge_files(
 
         user_id = __user__.get('id')
         user_role = __user__.get('role', 'user')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         _matches, err = build_matcher(pattern, case_insensitive)
         if err:
@@ -2246,7 +2246,7 @@ async def view_knowledge_file(
 
         user_id = __user__.get('id')
         user_role = __user__.get('role', 'user')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         file = await Files.get_file_by_id(file_id)
         if not file:
@@ -2396,7 +2396,7 @@ async def list_knowledge(
 
         user_id = __user__.get('id')
         user_role = __user__.get('role', 'user')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         knowledge_bases = []
         files = []
@@ -2537,7 +2537,7 @@ async def query_knowledge_files(
 
         user_id = __user__.get('id')
         user_role = __user__.get('role', 'user')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
 
         embedding_function = __request__.app.state.EMBEDDING_FUNCTION
         if not embedding_function:
@@ -2731,7 +2731,7 @@ async def query_knowledge_bases(
         from open_webui.routers.knowledge import KNOWLEDGE_BASES_COLLECTION
 
         user_id = __user__.get('id')
-        user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+        user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
         query_embedding = await __request__.app.state.EMBEDDING_FUNCTION(query)
 
         # Min-heap of (distance, knowledge_base_id) - only holds top `count` results
@@ -2841,7 +2841,7 @@ async def view_skill(
         # Check user access
         user_role = __user__.get('role', 'user')
         if user_role != 'admin' and skill.user_id != user_id:
-            user_group_ids = [group.id for group in await Groups.get_groups_by_member_id(user_id)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
             if not await AccessGrants.has_access(
                 user_id=user_id,
                 resource_type='skill',
@@ -3548,7 +3548,7 @@ async def create_calendar_event(
             from open_webui.models.access_grants import AccessGrants
             from open_webui.models.groups import Groups
 
-            user_group_ids = [g.id for g in await Groups.get_groups_by_member_id(user_id)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
             if not await AccessGrants.has_access(
                 user_id=user_id,
                 resource_type='calendar',
@@ -3668,7 +3668,7 @@ async def update_calendar_event(
             cal = await Calendars.get_calendar_by_id(event.calendar_id)
             if not cal:
                 return json.dumps({'error': 'Access denied'})
-            user_group_ids = [g.id for g in await Groups.get_groups_by_member_id(user_id)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
             if not await AccessGrants.has_access(
                 user_id=user_id,
                 resource_type='calendar',
@@ -3771,7 +3771,7 @@ async def delete_calendar_event(
             cal = await Calendars.get_calendar_by_id(event.calendar_id)
             if not cal:
                 return json.dumps({'error': 'Access denied'})
-            user_group_ids = [g.id for g in await Groups.get_groups_by_member_id(user_id)]
+            user_group_ids = await Groups.get_group_ids_by_member_id(user_id)
             if not await AccessGrants.has_access(
                 user_id=user_id,
                 resource_type='calendar',
@@ -125,8 +125,7 @@ async def has_access(
         return False
 
     if user_group_ids is None:
-        user_groups = await Groups.get_groups_by_member_id(user_id, db=db)
-        user_group_ids = {group.id for group in user_groups}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user_id, db=db))
 
     for grant in access_grants:
         if not isinstance(grant, dict):
@@ -162,7 +161,7 @@ async def has_connection_access(
         return True
 
     if user_group_ids is None:
-        user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id)}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id))
 
     access_grants = (connection.get('config') or {}).get('access_grants', [])
     return await has_access(user.id, 'read', access_grants, user_group_ids)
@@ -325,7 +324,7 @@ async def check_model_access(
         if user.role != 'admin':
             from open_webui.models.access_grants import AccessGrants
 
-            user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id)}
+            user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id))
             if not (
                 user.id == model_info.user_id
                 or await AccessGrants.has_access(
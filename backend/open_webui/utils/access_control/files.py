@@ -43,7 +43,7 @@ async def has_access_to_file(
     # the object's OWNER owns that file; otherwise a read-only file laundered into an object
     # the user controls would gain write/delete on it (CWE-863). Read access is unaffected.
     knowledge_bases = await Knowledges.get_knowledges_by_file_id(file_id, db=db)
-    user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id, db=db)}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
     for knowledge_base in knowledge_bases:
         if (
             knowledge_base.user_id == user.id
@@ -88,12 +88,28 @@ async def has_access_to_file(
 
     # Check if the file is directly attached to a shared workspace model (per the ownership
     # note above, model write is conferred only for files the model owner owns).
-    for model in await Models.get_models_by_user_id(user.id, permission=access_type, db=db):
-        knowledge_items = getattr(model.meta, 'knowledge', None) or []
-        for item in knowledge_items:
-            if isinstance(item, dict) and item.get('type') == 'file' and item.get('id') == file.id:
-                if access_type == 'read' or model.user_id == file.user_id:
-                    return True
+    # Only models whose meta mentions the file id are loaded, instead of every accessible model.
+    attached_models = [
+        model
+        for model in await Models.get_models_referencing_id(file.id, db=db)
+        if model.base_model_id is not None
+        and (access_type == 'read' or model.user_id == file.user_id)
+        and any(
+            isinstance(item, dict) and item.get('type') == 'file' and item.get('id') == file.id
+            for item in (getattr(model.meta, 'knowledge', None) or [])
+        )
+    ]
+    if any(model.user_id == user.id for model in attached_models):
+        return True
+    if await AccessGrants.get_accessible_resource_ids(
+        user_id=user.id,
+        resource_type='model',
+        resource_ids=[model.id for model in attached_models],
+        permission=access_type,
+        user_group_ids=user_group_ids,
+        db=db,
+    ):
+        return True
 
     return False
 
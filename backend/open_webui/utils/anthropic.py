@@ -1,5 +1,6 @@
 import json
 import logging
+import uuid
 
 import aiohttp
 from open_webui.env import (
@@ -399,8 +400,6 @@ def convert_openai_to_anthropic_response(openai_response: dict, model: str = '')
     """
     Convert a non-streaming OpenAI Chat Completions response to Anthropic Messages format.
     """
-    import uuid as _uuid
-
     choice = {}
     if openai_response.get('choices'):
         choice = openai_response['choices'][0]
@@ -434,7 +433,7 @@ def convert_openai_to_anthropic_response(openai_response: dict, model: str = '')
         content.append(
             {
                 'type': 'tool_use',
-                'id': tool_call.get('id', f'toolu_{_uuid.uuid4().hex[:24]}'),
+                'id': tool_call.get('id', f'toolu_{uuid.uuid4().hex[:24]}'),
                 'name': function.get('name', ''),
                 'input': tool_input,
             }
@@ -452,7 +451,7 @@ def convert_openai_to_anthropic_response(openai_response: dict, model: str = '')
         usage['cache_read_input_tokens'] = openai_usage['cache_read_input_tokens']
 
     return {
-        'id': openai_response.get('id', f'msg_{_uuid.uuid4().hex[:24]}'),
+        'id': openai_response.get('id', f'msg_{uuid.uuid4().hex[:24]}'),
         'type': 'message',
         'role': 'assistant',
         'content': content,
@@ -477,9 +476,7 @@ async def openai_stream_to_anthropic_stream(openai_stream_generator, model: str
     parallel calls sharing the same index get distinct Anthropic tool_use
     blocks. Each block follows the Anthropic lifecycle: start -> delta -> stop.
     """
-    import uuid as _uuid
-
-    message_id = f'msg_{_uuid.uuid4().hex[:24]}'
+    message_id = f'msg_{uuid.uuid4().hex[:24]}'
     input_tokens = 0
     output_tokens = 0
     stop_reason = 'end_turn'
@@ -620,7 +617,7 @@ async def openai_stream_to_anthropic_stream(openai_stream_generator, model: str
                         else:
                             # First delta for this index with no id; create a
                             # provisional entry with a generated fallback id.
-                            fallback_id = f'toolu_{_uuid.uuid4().hex[:24]}'
+                            fallback_id = f'toolu_{uuid.uuid4().hex[:24]}'
                             tracked_tool_calls[fallback_id] = {
                                 'id': fallback_id,
                                 'name': tool_call_name,
@@ -134,6 +134,9 @@ class AuditLoggingMiddleware:
         self.audit_logger = AuditLogger(logger)
         self.excluded_paths = excluded_paths or []
         self.included_paths = included_paths or []
+        # Path filters are fixed for the app's lifetime; compile them once instead of per request
+        self.included_paths_re = re.compile(r'^/api(?:/v1)?/(' + '|'.join(self.included_paths) + r')\b')
+        self.excluded_paths_re = re.compile(r'^/api(?:/v1)?/(' + '|'.join(self.excluded_paths) + r')\b')
         self.max_body_size = max_body_size
         self.audited_methods = set(self.DEFAULT_AUDITED_METHODS)
         if audit_get_requests:
@@ -230,14 +233,12 @@ class AuditLoggingMiddleware:
 
         # Whitelist mode: only log paths that match included_paths
         if self.included_paths:
-            pattern = re.compile(r'^/api(?:/v1)?/(' + '|'.join(self.included_paths) + r')\b')
-            if not pattern.match(request.url.path):
+            if not self.included_paths_re.match(request.url.path):
                 return True  # Skip: path not in whitelist
             return False  # Do NOT skip: path is in whitelist
 
         # Blacklist mode: skip paths that match excluded_paths
-        pattern = re.compile(r'^/api(?:/v1)?/(' + '|'.join(self.excluded_paths) + r')\b')
-        if pattern.match(request.url.path):
+        if self.excluded_paths_re.match(request.url.path):
             return True
 
         return False
@@ -156,7 +156,7 @@ async def generate_chat_completion(
     bypass_filter: bool = False,
     bypass_system_prompt: bool = False,
 ):
-    log.debug(f'generate_chat_completion: {form_data}')
+    log.debug('generate_chat_completion: %s', form_data)
     if BYPASS_MODEL_ACCESS_CONTROL:
         bypass_filter = True
 
@@ -216,8 +216,9 @@ async def generate_chat_completion(
         # from a path that did NOT go through process_chat_payload (e.g.,
         # background tasks for title/follow-up/tags generation), resolve now.
         if not selected_model_id and model.get('owned_by') == 'arena':
-            model_ids = model.get('info', {}).get('meta', {}).get('model_ids')
-            filter_mode = model.get('info', {}).get('meta', {}).get('filter_mode')
+            arena_meta = (model.get('info') or {}).get('meta') or {}
+            model_ids = arena_meta.get('model_ids')
+            filter_mode = arena_meta.get('filter_mode')
             if model_ids and filter_mode == 'exclude':
                 model_ids = [
                     available_model['id']
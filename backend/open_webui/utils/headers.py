@@ -1,5 +1,6 @@
 import logging
 import time
+from functools import lru_cache
 from typing import Any, Optional
 from urllib.parse import quote
 
@@ -17,20 +18,30 @@ from open_webui.env import (
 log = logging.getLogger(__name__)
 
 
-def _mint_forward_user_jwt(user: Any) -> str:
-    now = int(time.time())
+# Tokens are reused for half their lifetime, so each user is signed once per window instead of per request
+_FORWARD_USER_JWT_REUSE_SECONDS = max(FORWARD_USER_INFO_HEADER_JWT_EXPIRES_SECONDS // 2, 1)
+
+
+@lru_cache(maxsize=4096)
+def _sign_forward_user_jwt(user_id: str, email: str, name: str, role: str, issued_at: int) -> str:
     payload = {
-        'sub': str(user.id),
-        'email': str(user.email),
-        'name': str(user.name),
-        'role': str(user.role),
+        'sub': user_id,
+        'email': email,
+        'name': name,
+        'role': role,
         'iss': 'open-webui',
-        'iat': now,
-        'exp': now + FORWARD_USER_INFO_HEADER_JWT_EXPIRES_SECONDS,
+        'iat': issued_at,
+        'exp': issued_at + FORWARD_USER_INFO_HEADER_JWT_EXPIRES_SECONDS,
     }
     return jwt.encode(payload, FORWARD_USER_INFO_HEADER_JWT_SECRET, algorithm='HS256')
 
 
+def _mint_forward_user_jwt(user: Any) -> str:
+    now = int(time.time())
+    issued_at = now - now % _FORWARD_USER_JWT_REUSE_SECONDS
+    return _sign_forward_user_jwt(str(user.id), str(user.email), str(user.name), str(user.role), issued_at)
+
+
 def include_user_info_headers(headers: dict, user: Optional[Any] = None) -> dict:
     """
     Forward user identity to external backends: signed JWT in
@@ -150,6 +150,8 @@ DEFAULT_REASONING_TAGS = [
 
 DEFAULT_SOLUTION_TAGS = [('<|begin_of_solution|>', '<|end_of_solution|>')]
 DEFAULT_CODE_INTERPRETER_TAGS = [('<code_interpreter>', '</code_interpreter>')]
+CODE_INTERPRETER_IMAGE_LINE_RE = re.compile(r'data:image/\w+;base64')
+TAG_ATTRIBUTE_RE = re.compile(r'(\w+)\s*=\s*"([^"]+)"')
 
 
 def output_id(prefix: str) -> str:
@@ -1127,7 +1129,7 @@ async def chat_completion_tools_handler(
 
     try:
         response = await generate_chat_completion(request, form_data=payload, user=user)
-        log.debug(f'{response=}')
+        log.debug('response=%r', response)
         content = await get_content_from_response(response)
         log.debug(f'{content=}')
 
@@ -1741,7 +1743,8 @@ async def chat_completion_files_handler(
     __event_emitter__ = extra_params['__event_emitter__']
     sources = []
 
-    if files := body.get('metadata', {}).get('files', None):
+    body_metadata = body.get('metadata') or {}
+    if files := body_metadata.get('files', None):
         # Check if all files are in full context mode
         all_full_context = all(item.get('context') == 'full' for item in files)
 
@@ -1754,7 +1757,7 @@ async def chat_completion_files_handler(
                         'model': body['model'],
                         'messages': body['messages'],
                         'type': 'retrieval',
-                        'chat_id': body.get('metadata', {}).get('chat_id'),
+                        'chat_id': body_metadata.get('chat_id'),
                     },
                     user,
                 )
@@ -2050,6 +2053,7 @@ def sanitize_tool_pairs(messages: list[dict]) -> list[dict]:
 
 
 SKILL_MENTION_RE = re.compile(r'<\$([^|>]+)(?:\|[^>]*)?>')
+SKILL_MENTION_STRIP_RE = re.compile(r'<\$[^|>]+(?:\|([^>]*))?>')
 
 
 def _get_text_parts(message: dict) -> list[str]:
@@ -2073,17 +2077,16 @@ def extract_skill_ids_from_messages(messages: list[dict]) -> set[str]:
 
 def strip_skill_mentions(messages: list[dict]) -> None:
     """Replace <$skillId|label> mention tags with the label in message content in-place."""
-    strip_re = re.compile(r'<\$[^|>]+(?:\|([^>]*))?>')
     for message in messages:
         content = message.get('content')
-        if isinstance(content, str) and strip_re.search(content):
-            message['content'] = strip_re.sub(r'\1', content).strip()
+        if isinstance(content, str) and SKILL_MENTION_STRIP_RE.search(content):
+            message['content'] = SKILL_MENTION_STRIP_RE.sub(r'\1', content).strip()
         elif isinstance(content, list):
             for part in content:
                 if isinstance(part, dict) and part.get('type') == 'text':
                     text = part.get('text', '')
-                    if strip_re.search(text):
-                        part['text'] = strip_re.sub(r'\1', text).strip()
+                    if SKILL_MENTION_STRIP_RE.search(text):
+                        part['text'] = SKILL_MENTION_STRIP_RE.sub(r'\1', text).strip()
 
 
 async def connect_mcp_server(
@@ -2150,8 +2153,9 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     # processing (knowledge, capabilities, tools, params) uses its settings
     # instead of the empty arena wrapper.
     if model.get('owned_by') == 'arena':
-        arena_model_ids = model.get('info', {}).get('meta', {}).get('model_ids')
-        arena_filter_mode = model.get('info', {}).get('meta', {}).get('filter_mode')
+        arena_meta = (model.get('info') or {}).get('meta') or {}
+        arena_model_ids = arena_meta.get('model_ids')
+        arena_filter_mode = arena_meta.get('filter_mode')
         if arena_model_ids and arena_filter_mode == 'exclude':
             arena_model_ids = [
                 available_model['id']
@@ -2176,7 +2180,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
             metadata['selected_model_id'] = selected_model_id
 
     form_data = apply_params_to_form_data(form_data, model)
-    log.debug(f'form_data: {form_data}')
+    log.debug('form_data: %s', form_data)
 
     # Guided regeneration: extract before it reaches the LLM provider
     regeneration_prompt = form_data.pop('regeneration_prompt', None)
@@ -2316,6 +2320,9 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     events = []
     sources = []
 
+    # Resolved once up front; recomputed after the inlet filters, which may rewrite metadata params
+    legacy_function_calling = (metadata.get('params') or {}).get('function_calling') == 'legacy'
+
     # Folder "Project" handling
     # Check if the request has chat_id and is inside of a folder
     # Uses lightweight column query — only fetches folder_id, not the full chat JSON blob
@@ -2328,6 +2335,10 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     if not folder_id:
         folder_id = metadata.get('folder_id', None)
 
+    # Accessible files per folder id, so a folder that is also attached as a file
+    # item below is not fetched and access-checked a second time
+    accessible_folder_files = {}
+
     if folder_id and user:
         folder = await Folders.get_folder_by_id_and_user_id(folder_id, user.id)
 
@@ -2337,7 +2348,8 @@ async def process_chat_payload(request, form_data, user, metadata, model):
             if 'files' in folder.data:
                 # Defensive: filter to entries the caller can still read.
                 allowed_files = await get_accessible_folder_files(folder.data['files'], user)
-                if metadata.get('params', {}).get('function_calling') == 'legacy':
+                accessible_folder_files[folder_id] = allowed_files
+                if legacy_function_calling:
                     form_data['files'] = [
                         *allowed_files,
                         *form_data.get('files', []),
@@ -2349,9 +2361,10 @@ async def process_chat_payload(request, form_data, user, metadata, model):
 
     # Model "Knowledge" handling
     user_message = get_last_user_message(form_data['messages'])
-    model_knowledge = model.get('info', {}).get('meta', {}).get('knowledge', False)
+    model_meta = (model.get('info') or {}).get('meta') or {}
+    model_knowledge = model_meta.get('knowledge', False)
 
-    if model_knowledge and metadata.get('params', {}).get('function_calling') == 'legacy':
+    if model_knowledge and legacy_function_calling:
         await event_emitter(
             {
                 'type': 'status',
@@ -2412,6 +2425,8 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     except Exception as e:
         raise Exception(f'{e}')
 
+    legacy_function_calling = (metadata.get('params') or {}).get('function_calling') == 'legacy'
+
     features = form_data.pop('features', None) or {}
     extra_params['__features__'] = features
     if features:
@@ -2432,12 +2447,12 @@ async def process_chat_payload(request, form_data, user, metadata, model):
 
         if 'web_search' in features and features['web_search']:
             # Skip forced RAG web search when native FC is enabled - model can use web_search tool
-            if metadata.get('params', {}).get('function_calling') == 'legacy':
+            if legacy_function_calling:
                 form_data = await chat_web_search_handler(request, form_data, extra_params, user)
 
         if 'image_generation' in features and features['image_generation']:
             # Skip forced image generation when native FC is enabled - model can use generate_image tool
-            if metadata.get('params', {}).get('function_calling') == 'legacy':
+            if legacy_function_calling:
                 form_data = await chat_image_generation_handler(request, form_data, extra_params, user)
 
         if 'code_interpreter' in features and features['code_interpreter']:
@@ -2445,7 +2460,7 @@ async def process_chat_payload(request, form_data, user, metadata, model):
 
             # Skip XML-tag prompt injection when native FC is enabled —
             # execute_code will be injected as a builtin tool instead
-            if metadata.get('params', {}).get('function_calling') == 'legacy':
+            if legacy_function_calling:
                 prompt = (
                     await Config.get('code_interpreter.prompt_template')
                     if await Config.get('code_interpreter.prompt_template') != ''
@@ -2487,15 +2502,15 @@ async def process_chat_payload(request, form_data, user, metadata, model):
     mentioned_skill_ids = extract_skill_ids_from_messages(form_data.get('messages', []))
     skill_ids = (
         set(form_data.pop('skill_ids', None) or [])
-        | set(model.get('info', {}).get('meta', {}).get('skillIds', []))
+        | set(model_meta.get('skillIds', []))
         | mentioned_skill_ids
     )
     available_skills = []
     view_skill_ids = []
     use_builtin_tools = (
         bool(metadata.get('session_id'))
-        and metadata.get('params', {}).get('function_calling') != 'legacy'
-        and (model.get('info', {}).get('meta', {}).get('capabilities') or {}).get('builtin_tools', True)
+        and not legacy_function_calling
+        and (model_meta.get('capabilities') or {}).get('builtin_tools', True)
     )
 
     if skill_ids:
@@ -2558,10 +2573,17 @@ async def process_chat_payload(request, form_data, user, metadata, model):
                 # Get folder files
                 folder_id = file_item.get('id', None)
                 if folder_id:
-                    folder = await Folders.get_folder_by_id_and_user_id(folder_id, user.id)
-                    if folder and folder.data and 'files' in folder.data:
+                    if folder_id not in accessible_folder_files:
+                        folder = await Folders.get_folder_by_id_and_user_id(folder_id, user.id)
+                        accessible_folder_files[folder_id] = (
+                            await get_accessible_folder_files(folder.data['files'], user)
+                            if folder and folder.data and 'files' in folder.data
+                            else None
+                        )
+                    folder_files = accessible_folder_files[folder_id]
+                    if folder_files is not None:
                         files = [f for f in files if f.get('id', None) != folder_id]
-                        files = [*files, *await get_accessible_folder_files(folder.data['files'], user)]
+                        files = [*files, *folder_files]
 
         # files = [*files, *[{"type": "url", "url": url, "name": url} for url in urls]]
         # Remove duplicate files based on their content
@@ -3580,7 +3602,7 @@ async def streaming_chat_response_handler(response, ctx):
                     attributes = {}
                     if not tag_content:
                         return attributes
-                    matches = re.findall(r'(\w+)\s*=\s*"([^"]+)"', tag_content)
+                    matches = TAG_ATTRIBUTE_RE.findall(tag_content)
                     for key, value in matches:
                         attributes[key] = value
                     return attributes
@@ -3722,7 +3744,9 @@ async def streaming_chat_response_handler(response, ctx):
                     else:
                         block_content = get_last_text(output)
 
-                    if re.search(end_tag_pattern, block_content):
+                    # end_tag_pattern is an escaped literal, so a substring test is equivalent
+                    # and avoids a regex cache lookup on every streamed delta
+                    if end_tag in block_content:
                         end_flag = True
 
                         # Strip start and end tags from content
@@ -4612,7 +4636,7 @@ async def streaming_chat_response_handler(response, ctx):
                                     continue
 
                         # Ensure arguments are valid JSON for downstream LLM integrations
-                        log.debug(f'Parsed args from {tool_args} to {tool_function_params}')
+                        log.debug('Parsed args from %s to %s', tool_args, tool_function_params)
                         tool_call.setdefault('function', {})['arguments'] = json.dumps(tool_function_params)
 
                         tool_result = None
@@ -5029,7 +5053,7 @@ async def streaming_chat_response_handler(response, ctx):
                                 else:
                                     ci_output = {'stdout': 'Code interpreter engine not configured.'}
 
-                                log.debug(f'Code interpreter output: {ci_output}')
+                                log.debug('Code interpreter output: %s', ci_output)
 
                                 # Handle error responses from event_caller
                                 # (e.g. session disconnected, timeout)
@@ -5042,7 +5066,7 @@ async def streaming_chat_response_handler(response, ctx):
                                     if isinstance(stdout, str):
                                         stdoutLines = stdout.split('\n')
                                         for idx, line in enumerate(stdoutLines):
-                                            if re.match(r'data:image/\w+;base64', line):
+                                            if CODE_INTERPRETER_IMAGE_LINE_RE.match(line):
                                                 image_url = await get_image_url_from_base64(
                                                     request,
                                                     line,
@@ -5059,7 +5083,7 @@ async def streaming_chat_response_handler(response, ctx):
                                     if isinstance(result, str):
                                         resultLines = result.split('\n')
                                         for idx, line in enumerate(resultLines):
-                                            if re.match(r'data:image/\w+;base64', line):
+                                            if CODE_INTERPRETER_IMAGE_LINE_RE.match(line):
                                                 image_url = await get_image_url_from_base64(
                                                     request,
                                                     line,
@@ -57,13 +57,17 @@ def is_string_allowed(string: Union[str, Sequence[str]], filter_list: list[str |
     allow_list, block_list = get_allow_block_lists(filter_list)
     strings = [string] if isinstance(string, str) else list(string)
 
+    # str.endswith accepts a tuple of suffixes and checks them all in one C-level call
+    allowed_suffixes = tuple(allow_list)
+    blocked_suffixes = tuple(block_list)
+
     # If allow list is non-empty, require domain to match one of them
-    if allow_list:
-        if not any(s.endswith(allowed) for s in strings for allowed in allow_list):
+    if allowed_suffixes:
+        if not any(s.endswith(allowed_suffixes) for s in strings):
             return False
 
     # Block list always removes matches
-    if any(s.endswith(blocked) for s in strings for blocked in block_list):
+    if any(s.endswith(blocked_suffixes) for s in strings):
         return False
 
     return True
@@ -1039,10 +1043,11 @@ def strict_match_mime_type(supported: list[str] | str, header: str) -> str | Non
         return None
 
 
+URL_PATTERN = re.compile(r'(https?://[^\s]+)', re.IGNORECASE)  # Matches http and https URLs
+
+
 def extract_urls(text: str) -> list[str]:
-    # Regex pattern to match URLs
-    url_pattern = re.compile(r'(https?://[^\s]+)', re.IGNORECASE)  # Matches http and https URLs
-    return url_pattern.findall(text)
+    return URL_PATTERN.findall(text)
 
 
 # We believe in one architect of all that is seen and served.
@@ -288,7 +288,7 @@ async def get_all_models(request, refresh: bool = False, user: UserModel = None)
         try:
             await get_function_module_from_cache(request, function_id, function=function)
         except Exception as e:
-            log.debug(f'Failed to load function module for {function_id}: {e}')
+            log.debug('Failed to load function module for %s: %s', function_id, e)
 
     # Apply global model defaults to all models
     # Per-model overrides take precedence over global defaults
@@ -345,12 +345,12 @@ async def get_all_models(request, refresh: bool = False, user: UserModel = None)
         for action_id in action_ids:
             action_function = functions_by_id.get(action_id)
             if action_function is None:
-                log.info(f'Action not found: {action_id}')
+                log.debug('Action not found: %s', action_id)
                 continue
 
             function_module = functions_cache.get(action_id)
             if function_module is None:
-                log.info(f'Failed to load action module: {action_id}')
+                log.debug('Failed to load action module: %s', action_id)
                 continue
             model['actions'].extend(get_action_items_from_module(action_function, function_module))
 
@@ -358,17 +358,17 @@ async def get_all_models(request, refresh: bool = False, user: UserModel = None)
         for filter_id in filter_ids:
             filter_function = functions_by_id.get(filter_id)
             if filter_function is None:
-                log.info(f'Filter not found: {filter_id}')
+                log.debug('Filter not found: %s', filter_id)
                 continue
 
             function_module = functions_cache.get(filter_id)
             if function_module is None:
-                log.info(f'Failed to load filter module: {filter_id}')
+                log.debug('Failed to load filter module: %s', filter_id)
                 continue
             if getattr(function_module, 'toggle', None):
                 model['filters'].extend(get_filter_items_from_module(filter_function, function_module))
 
-    log.debug(f'get_all_models() returned {len(models)} models')
+    log.debug('get_all_models() returned %d models', len(models))
 
     models_dict = {model['id']: model for model in models}
     if isinstance(request.app.state.MODELS, RedisDict):
@@ -428,7 +428,7 @@ async def get_filtered_models(models, user, db=None):
             if info:
                 model_infos[model['id']] = info
 
-        user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id, db=db)}
+        user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id, db=db))
 
         # Batch-fetch accessible resource IDs in a single query instead of N has_access calls
         accessible_model_ids = await AccessGrants.get_accessible_resource_ids(
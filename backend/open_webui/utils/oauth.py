@@ -1161,12 +1161,9 @@ class OAuthClientManager:
                     _normalize_token_expiry(token)
 
                     # Clean up any existing sessions for this user/client_id first
-                    sessions = await OAuthSessions.get_sessions_by_user_id(user_id)
-                    for session in sessions:
-                        if session.provider == client_id:
-                            await OAuthSessions.delete_session_by_id(session.id)
+                    await OAuthSessions.delete_sessions_by_user_id_and_provider(user_id, client_id)
 
-                    session = await OAuthSessions.create_session(
+                    await OAuthSessions.create_session(
                         user_id=user_id,
                         provider=client_id,
                         token=token,
@@ -1508,13 +1505,15 @@ class OAuthManager:
                 user_oauth_groups = []
 
         user_current_groups: list[GroupModel] = await Groups.get_groups_by_member_id(user.id, db=db)
+        # Name sets for the membership checks below, which run once per group
+        user_oauth_group_names = set(user_oauth_groups)
+        user_current_group_names = {g.name for g in user_current_groups}
         all_available_groups: list[GroupModel] = await Groups.get_all_groups(db=db)
 
         # Create groups if they don't exist and creation is enabled
         if auth_config.ENABLE_OAUTH_GROUP_CREATION:
             log.debug('Checking for missing groups to create...')
             all_group_names = {g.name for g in all_available_groups}
-            groups_created = False
             # Determine creator ID: Prefer admin, fallback to current user if no admin exists
             admin_user = await Users.get_super_admin_user()
             creator_id = admin_user.id if admin_user else user.id
@@ -1536,19 +1535,15 @@ class OAuthManager:
                             log.info(
                                 f"Successfully created group '{group_name}' with ID {created_group.id} using creator ID {creator_id}"
                             )
-                            groups_created = True
-                            # Add to local set to prevent duplicate creation attempts in this run
+                            # Add to the local snapshot instead of re-reading every group, which
+                            # also prevents duplicate creation attempts in this run
                             all_group_names.add(group_name)
+                            all_available_groups.insert(0, created_group)
                         else:
                             log.error(f"Failed to create group '{group_name}' via OAuth.")
                     except Exception as e:
                         log.error(f"Error creating group '{group_name}' via OAuth: {e}")
 
-            # Refresh the list of all available groups if any were created
-            if groups_created:
-                all_available_groups = await Groups.get_all_groups(db=db)
-                log.debug('Refreshed list of all available groups after creation.')
-
         log.debug(f'Oauth Groups claim: {oauth_claim}')
         log.debug(f'User oauth groups: {user_oauth_groups}')
         log.debug(f"User's current groups: {[g.name for g in user_current_groups]}")
@@ -1558,7 +1553,7 @@ class OAuthManager:
         for group_model in user_current_groups:
             if (
                 user_oauth_groups
-                and group_model.name not in user_oauth_groups
+                and group_model.name not in user_oauth_group_names
                 and not is_in_blocked_groups(group_model.name, blocked_groups)
             ):
                 # Remove group from user
@@ -1585,8 +1580,8 @@ class OAuthManager:
         for group_model in all_available_groups:
             if (
                 user_oauth_groups
-                and group_model.name in user_oauth_groups
-                and not any(gm.name == group_model.name for gm in user_current_groups)
+                and group_model.name in user_oauth_group_names
+                and group_model.name not in user_current_group_names
                 and not is_in_blocked_groups(group_model.name, blocked_groups)
             ):
                 # Add user to group
@@ -1992,16 +1987,12 @@ class OAuthManager:
 
             # Enforce max concurrent sessions per user/provider to prevent
             # unbounded growth while allowing multi-device usage
-            sessions = await OAuthSessions.get_sessions_by_user_id(user.id, db=db)
-            provider_sessions = sorted(
-                [session for session in sessions if session.provider == provider],
-                key=lambda session: session.created_at,
-                reverse=True,
-            )
+            provider_session_ids = await OAuthSessions.get_session_ids_by_user_id_and_provider(user.id, provider, db=db)
             # Keep the newest sessions up to the limit, prune the rest
-            if len(provider_sessions) >= OAUTH_MAX_SESSIONS_PER_USER:
-                for old_session in provider_sessions[OAUTH_MAX_SESSIONS_PER_USER - 1 :]:
-                    await OAuthSessions.delete_session_by_id(old_session.id, db=db)
+            if len(provider_session_ids) >= OAUTH_MAX_SESSIONS_PER_USER:
+                await OAuthSessions.delete_sessions_by_ids(
+                    provider_session_ids[OAUTH_MAX_SESSIONS_PER_USER - 1 :], db=db
+                )
 
             session = await OAuthSessions.create_session(
                 user_id=user.id,
@@ -2188,9 +2179,7 @@ class OAuthManager:
 
         revoked_count = 0
         for user in users_to_logout:
-            sessions = await OAuthSessions.get_sessions_by_user_id(user.id, db=db)
-            for oauth_session in sessions:
-                await OAuthSessions.delete_session_by_id(oauth_session.id, db=db)
+            await OAuthSessions.delete_sessions_by_user_id(user.id, db=db)
 
             if redis:
                 revocation_key = f'{REDIS_KEY_PREFIX}:auth:user:{user.id}:revoked_at'
@@ -2203,7 +2192,7 @@ class OAuthManager:
 
             log.info(
                 f'Back-channel logout: revoked sessions for user {user.id} '
-                f'(email={user.email}, provider={matched_provider}, sessions_deleted={len(sessions)})'
+                f'(email={user.email}, provider={matched_provider})'
             )
 
         log.info(
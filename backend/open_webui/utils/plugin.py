@@ -22,6 +22,26 @@ from open_webui.models.tools import Tools
 
 log = logging.getLogger(__name__)
 
+GITHUB_TREE_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/tree/([^/]+)/(.*)')
+GITHUB_BLOB_URL_PATTERN = re.compile(r'https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)')
+
+
+def github_url_to_raw_url(url: str) -> str:
+    # Handle 'tree' (folder) URLs (add main.py at the end)
+    m1 = GITHUB_TREE_URL_PATTERN.match(url)
+    if m1:
+        org, repo, branch, path = m1.groups()
+        return f'https://raw.githubusercontent.com/{org}/{repo}/refs/heads/{branch}/{path.rstrip("/")}/main.py'
+
+    # Handle 'blob' (file) URLs
+    m2 = GITHUB_BLOB_URL_PATTERN.match(url)
+    if m2:
+        org, repo, branch, path = m2.groups()
+        return f'https://raw.githubusercontent.com/{org}/{repo}/refs/heads/{branch}/{path}'
+
+    # No match; return as-is
+    return url
+
 
 def resolve_valves_schema_options(valves_class: type, schema: dict, user: Any = None) -> dict:
     """
@@ -259,7 +259,7 @@ async def get_tools(request: Request, tool_ids: list[str], user: UserModel, extr
     tools_dict = {}
 
     # Get user's group memberships for access control checks
-    user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id)}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id))
 
     # Batch-fetch all DB tools in one query instead of one per tool_id
     tool_models = await Tools.get_tools_by_ids(tool_ids)
@@ -1191,7 +1191,7 @@ async def get_terminal_tools(
         log.warning(f'Terminal server not found: {terminal_id}')
         return {}
 
-    user_group_ids = {group.id for group in await Groups.get_groups_by_member_id(user.id)}
+    user_group_ids = set(await Groups.get_group_ids_by_member_id(user.id))
     if not await has_connection_access(user, connection, user_group_ids):
         log.warning(f'Access denied to terminal {terminal_id} for user {user.id}')
         return {}